@@ -18,6 +18,7 @@ import shutil
 from multi_agents.main import run_research_task
 from gpt_researcher.document.document import DocumentLoader
 from gpt_researcher.master.actions import stream_output
+from gpt_researcher.utils.http import close_http_session
 
 
 class ResearchRequest(BaseModel):
@@ -57,6 +58,11 @@ def startup_event():
     app.mount("/outputs", StaticFiles(directory="outputs"), name="outputs")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_http_session()
+
+
 @app.get("/")
 async def read_root(request: Request):
     return templates.TemplateResponse(
@@ -17,6 +17,7 @@ from dotenv import load_dotenv
 
 from gpt_researcher import GPTResearcher
 from gpt_researcher.utils.enum import ReportType
+from gpt_researcher.utils.http import close_http_session
 
 # =============================================================================
 # CLI
@@ -75,9 +76,12 @@ async def main(args):
         query=args.query,
         report_type=args.report_type)
 
-    await researcher.conduct_research()
+    try:
+        await researcher.conduct_research()
 
-    report = await researcher.write_report()
+        report = await researcher.write_report()
+    finally:
+        await close_http_session()
 
     # Write the report to a file
     artifact_filepath = f"outputs/{uuid4()}.md"
@@ -14,6 +14,10 @@ class Config:
         self.retrievers = self.parse_retrievers(os.getenv("RETRIEVER", "bing"))
         # self.embedding_provider = os.getenv("EMBEDDING_PROVIDER", "openai")
         self.embedding_provider = os.getenv("EMBEDDING_PROVIDER", "azure_openai")
+        self.embedding_cache_path = os.getenv(
+            "EMBEDDING_CACHE_PATH", "~/.cache/gpt-researcher/embeddings"
+        )
+        self.embedding_cache_max_vectors = int(os.getenv("EMBEDDING_CACHE_MAX_VECTORS", 100000))
         self.similarity_threshold = int(os.getenv("SIMILARITY_THRESHOLD", 0.42))
         # self.llm_provider = os.getenv("LLM_PROVIDER", "openai")
         self.llm_provider = os.getenv("LLM_PROVIDER", "litellm")
@@ -38,12 +42,42 @@ class Config:
         self.max_search_results_per_query = int(
             os.getenv("MAX_SEARCH_RESULTS_PER_QUERY", 5)
         )
+        self.max_scrape_urls_per_query = int(os.getenv("MAX_SCRAPE_URLS_PER_QUERY", 10))
+        self.snippet_similarity_threshold = float(os.getenv("SNIPPET_SIMILARITY_THRESHOLD", 0.2))
+        self.retriever_content_min_length = int(os.getenv("RETRIEVER_CONTENT_MIN_LENGTH", 1000))
+        self.visited_urls_bloom_capacity = int(os.getenv("VISITED_URLS_BLOOM_CAPACITY", 0))
+        self.retriever_timeout = float(os.getenv("RETRIEVER_TIMEOUT", 15))
+        self.search_cache_ttl = int(os.getenv("SEARCH_CACHE_TTL", 3600))
+        self.search_cache_max_entries = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", 1000))
         self.memory_backend = os.getenv("MEMORY_BACKEND", "local")
         self.total_words = int(os.getenv("TOTAL_WORDS", 900))
         self.report_format = os.getenv("REPORT_FORMAT", "APA")
         self.max_iterations = int(os.getenv("MAX_ITERATIONS", 3))
         self.agent_role = os.getenv("AGENT_ROLE", None)
         self.scraper = os.getenv("SCRAPER", "bs")
+        self.http_max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+        self.http_max_connections_per_host = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", 8))
+        self.http_timeout = float(os.getenv("HTTP_TIMEOUT", 30))
+        self.scraper_cache_path = os.getenv(
+            "SCRAPER_CACHE_PATH", "~/.cache/gpt-researcher/pages.sqlite3"
+        )
+        self.scraper_cache_ttl = int(os.getenv("SCRAPER_CACHE_TTL", 86400))
+        self.scraper_cache_max_mb = int(os.getenv("SCRAPER_CACHE_MAX_MB", 512))
+        self.scrape_tail_timeout = float(os.getenv("SCRAPE_TAIL_TIMEOUT", 5))
+        self.scraper_max_per_host = int(os.getenv("SCRAPER_MAX_PER_HOST", 4))
+        self.scraper_host_rate = float(os.getenv("SCRAPER_HOST_RATE", 2))
+        self.scraper_min_concurrency = int(os.getenv("SCRAPER_MIN_CONCURRENCY", 4))
+        self.scraper_max_concurrency = int(os.getenv("SCRAPER_MAX_CONCURRENCY", 64))
+        self.scraper_initial_concurrency = int(os.getenv("SCRAPER_INITIAL_CONCURRENCY", 16))
+        self.scraper_max_bytes = int(os.getenv("SCRAPER_MAX_BYTES", 10 * 1024 * 1024))
+        # None starts one worker per CPU the process may run on, see extraction.default_workers
+        self.scraper_extraction_workers = (
+            int(os.getenv("SCRAPER_EXTRACTION_WORKERS")) if os.getenv("SCRAPER_EXTRACTION_WORKERS") else None
+        )
+        self.near_duplicate_threshold = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", 0.8))
+        self.chunk_size = int(os.getenv("CHUNK_SIZE", 1000))
+        self.chunk_overlap = int(os.getenv("CHUNK_OVERLAP", 100))
+        self.chunk_tokenizer = os.getenv("CHUNK_TOKENIZER", None)
         self.max_subtopics = os.getenv("MAX_SUBTOPICS", 3)
         self.report_source = os.getenv("REPORT_SOURCE", None)
         self.doc_path = os.getenv("DOC_PATH", "")
@@ -1,4 +1,4 @@
 from .compression import ContextCompressor
-from .retriever import SearchAPIRetriever
+from .index import ContextIndex
 
-__all__ = ['ContextCompressor', 'SearchAPIRetriever']
+__all__ = ['ContextCompressor', 'ContextIndex']
@@ -0,0 +1,199 @@
+from array import array
+from bisect import bisect_right
+
+# Break points tried in order, the first one leaving a chunk of at least half the size wins
+SEPARATORS = ("\n\n", "\n", ". ", " ")
+
+
+class SpanChunker:
+    """
+    Splits texts into overlapping chunks, recorded as (start, end) offsets into the text
+    instead of copied strings. Chunks break at paragraph, line, sentence or word
+    boundaries like langchain's RecursiveCharacterTextSplitter, and are sized in
+    characters, or in tokens when a tiktoken encoding is given.
+    """
+
+    def __init__(self, chunk_size=1000, chunk_overlap=100, encoding=None):
+        """
+        Initialize the SpanChunker class.
+        Args:
+            chunk_size: Maximum size of a chunk
+            chunk_overlap: Size shared by consecutive chunks
+            encoding: Optional tiktoken encoding, sizes are counted in its tokens instead of characters
+        """
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"chunk_overlap ({chunk_overlap}) must be smaller than chunk_size ({chunk_size})")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.encoding = encoding
+
+    @classmethod
+    def from_config(cls, cfg):
+        """Builds the chunker configured in `cfg`"""
+        encoding = None
+        if cfg.chunk_tokenizer:
+            import tiktoken
+            encoding = tiktoken.get_encoding(cfg.chunk_tokenizer)
+        return cls(cfg.chunk_size, cfg.chunk_overlap, encoding)
+
+    def _token_starts(self, text):
+        # Character offset of every token, to turn token budgets into character offsets
+        _, offsets = self.encoding.decode_with_offsets(self.encoding.encode(text, disallowed_special=()))
+        return offsets
+
+    def split(self, text):
+        """
+        Args:
+            text: The text to split
+
+        Returns:
+            list: (start, end) offsets of the chunks, whitespace trimmed
+        """
+        length = len(text)
+        token_starts = self._token_starts(text) if self.encoding is not None else None
+
+        def advance(position, size):
+            # Offset `size` characters or tokens after `position`
+            if token_starts is None:
+                return min(position + size, length)
+            index = bisect_right(token_starts, position) - 1 + size
+            return token_starts[index] if index < len(token_starts) else length
+
+        def retreat(position, size):
+            # Offset `size` characters or tokens before `position`
+            if token_starts is None:
+                return position - size
+            index = bisect_right(token_starts, position) - 1 - size
+            return token_starts[index] if index >= 0 else 0
+
+        spans = []
+        start = self._skip_whitespace(text, 0)
+        while start < length:
+            limit = advance(start, self.chunk_size)
+            end = limit if limit >= length else self._break(text, start, limit)
+            trimmed_end = end
+            while trimmed_end > start and text[trimmed_end - 1].isspace():
+                trimmed_end -= 1
+            if trimmed_end > start:
+                spans.append((start, trimmed_end))
+            if end >= length:
+                break
+
+            next_start = retreat(end, self.chunk_overlap)
+            if next_start <= start:
+                next_start = end
+            elif next_start < end:
+                # Start the overlap on a word
+                space = text.find(" ", next_start, end)
+                next_start = space + 1 if space != -1 else end
+            start = self._skip_whitespace(text, next_start)
+        return spans
+
+    @staticmethod
+    def _break(text, start, limit):
+        minimum = start + (limit - start) // 2
+        for separator in SEPARATORS:
+            cut = text.rfind(separator, minimum, limit)
+            if cut != -1:
+                return cut + len(separator)
+        return limit
+
+    @staticmethod
+    def _skip_whitespace(text, position):
+        length = len(text)
+        while position < length and text[position].isspace():
+            position += 1
+        return position
+
+
+class Chunk:
+    """
+    Lazy view of one chunk of a ChunkStore, with the `page_content` and `metadata` of a
+    langchain Document. The text is only sliced out of the page when it is read.
+    """
+
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def page_content(self):
+        return self.store.text(self.index)
+
+    @property
+    def metadata(self):
+        return self.store.metadata(self.index)
+
+
+class ChunkStore:
+    """
+    Chunks of many pages as (page_id, start, end) spans into each page's text, in three
+    compact integer arrays. The pages' texts and metadata are stored once, and no chunk
+    string exists until it is embedded or rendered.
+    """
+
+    def __init__(self, chunker=None):
+        """
+        Initialize the ChunkStore class.
+        Args:
+            chunker: SpanChunker splitting the pages, 1000 characters with 100 overlap by default
+        """
+        self.chunker = chunker or SpanChunker()
+        self.texts = []
+        self.metadatas = []
+        self.page_ids = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        return Chunk(self, int(index))
+
+    def add(self, text, metadata=None):
+        """
+        Splits a page and stores its chunks.
+        Args:
+            text: The text of the page
+            metadata: Metadata of the page, shared by all its chunks
+
+        Returns:
+            range: Indices of the page's chunks
+        """
+        return self.add_spans(text, self.chunker.split(text), metadata)
+
+    def add_spans(self, text, spans, metadata=None):
+        """
+        Stores the chunks of a page split beforehand.
+        Args:
+            text: The text of the page
+            spans: (start, end) offsets of its chunks
+            metadata: Metadata of the page, shared by all its chunks
+
+        Returns:
+            range: Indices of the page's chunks
+        """
+        first = len(self)
+        if spans:
+            page_id = len(self.texts)
+            self.texts.append(text)
+            self.metadatas.append(metadata if metadata is not None else {})
+            self.page_ids.extend([page_id] * len(spans))
+            for start, end in spans:
+                self.starts.append(start)
+                self.ends.append(end)
+        return range(first, len(self))
+
+    def text(self, index):
+        """The text of a chunk, sliced out of its page"""
+        return self.texts[self.page_ids[index]][self.starts[index]:self.ends[index]]
+
+    def texts_of(self, indices):
+        """The texts of several chunks, e.g. to embed them"""
+        return [self.text(index) for index in indices]
+
+    def metadata(self, index):
+        return self.metadatas[self.page_ids[index]]
@@ -1,15 +1,8 @@
 import os
 import asyncio
 from typing import Optional
-from .retriever import SearchAPIRetriever, SectionRetriever
-from langchain.retrievers import (
-    ContextualCompressionRetriever,
-)
-from langchain.retrievers.document_compressors import (
-    DocumentCompressorPipeline,
-    EmbeddingsFilter,
-)
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from .chunking import ChunkStore
+from .similarity import SimilarityMatrix
 from gpt_researcher.utils.costs import estimate_embedding_cost
 from gpt_researcher.memory.embeddings import OPENAI_EMBEDDING_MODEL, AZURE_EMBEDDING_MODEL
 
@@ -33,27 +26,26 @@ class VectorstoreCompressor:
 
 
 class ContextCompressor:
-    def __init__(self, documents, embeddings, max_results=5, **kwargs):
+    def __init__(self, documents, embeddings, max_results=5, chunker=None, **kwargs):
         self.max_results = max_results
         self.documents = documents
         self.kwargs = kwargs
         self.embeddings = embeddings
+        self.chunker = chunker
         self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.38)
 
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SearchAPIRetriever(
-            pages=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
+    def __get_chunks(self):
+        # Spans into the pages' text, chunk strings are only built to embed and print them
+        chunks = ChunkStore(self.chunker)
+        for page in self.documents:
+            chunks.add(page.get("raw_content", ""), {"title": page.get("title", ""), "source": page.get("url", "")})
+        return chunks
+
+    def __get_relevant_docs(self, chunks, chunk_vectors, query_vector, max_results):
+        matrix = SimilarityMatrix()
+        matrix.add(chunk_vectors)
+        rows, _ = matrix.top_k([query_vector], max_results, threshold=float(self.similarity_threshold))[0]
+        return [chunks[row] for row in rows]
 
     def __pretty_print_docs(self, docs, top_n):
         return f"\n".join(f"Source: {d.metadata.get('source')}\n"
@@ -62,52 +54,78 @@ class ContextCompressor:
                           for i, d in enumerate(docs) if i < top_n)
 
     def get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        chunks = self.__get_chunks()
         if cost_callback:
             # cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
             cost_callback(estimate_embedding_cost(model=AZURE_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = compressed_docs.invoke(query)
+        if not chunks:
+            return ""
+        chunk_vectors = self.embeddings.embed_documents(chunks.texts_of(range(len(chunks))))
+        query_vector = self.embeddings.embed_query(query)
+        relevant_docs = self.__get_relevant_docs(chunks, chunk_vectors, query_vector, max_results)
         return self.__pretty_print_docs(relevant_docs, max_results)
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        chunks = self.__get_chunks()
         if cost_callback:
             # cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
             cost_callback(estimate_embedding_cost(model=AZURE_EMBEDDING_MODEL, docs=self.documents))
-
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query)
+        if not chunks:
+            return ""
+        chunk_vectors, query_vector = await asyncio.gather(
+            self.embeddings.aembed_documents(chunks.texts_of(range(len(chunks)))),
+            self.embeddings.aembed_query(query),
+        )
+        relevant_docs = self.__get_relevant_docs(chunks, chunk_vectors, query_vector, max_results)
         return self.__pretty_print_docs(relevant_docs, max_results)
 
 
 class WrittenContentCompressor:
-    def __init__(self, documents, embeddings, similarity_threshold, **kwargs):
+    def __init__(self, documents, embeddings, similarity_threshold, chunker=None, **kwargs):
         self.documents = documents
         self.kwargs = kwargs
         self.embeddings = embeddings
+        self.chunker = chunker
         self.similarity_threshold = similarity_threshold
 
-    def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-        relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
-                                            similarity_threshold=self.similarity_threshold)
-        pipeline_compressor = DocumentCompressorPipeline(
-            transformers=[splitter, relevance_filter]
-        )
-        base_retriever = SectionRetriever(
-            sections=self.documents
-        )
-        contextual_retriever = ContextualCompressionRetriever(
-            base_compressor=pipeline_compressor, base_retriever=base_retriever
-        )
-        return contextual_retriever
+    def __get_chunks(self):
+        chunks = ChunkStore(self.chunker)
+        for section in self.documents:
+            chunks.add(section.get("written_content", ""), {"section_title": section.get("section_title", "")})
+        return chunks
 
     def __pretty_docs_list(self, docs, top_n):
         return [f"Title: {d.metadata.get('section_title')}\nContent: {d.page_content}\n" for i, d in enumerate(docs) if i < top_n]
 
     async def async_get_context(self, query, max_results=5, cost_callback=None):
-        compressed_docs = self.__get_contextual_retriever()
+        contexts = await self.async_get_contexts([query], max_results, cost_callback)
+        return contexts[0]
+
+    async def async_get_contexts(self, queries, max_results=5, cost_callback=None):
+        """
+        Retrieves the relevant written contents of several queries at once. The sections are
+        embedded a single time and all queries are scored with one matrix multiplication.
+
+        Args:
+            queries: List of queries
+            max_results: Number of contents to return per query
+            cost_callback: Callback for the embedding costs
+
+        Returns:
+            list: One list of relevant contents per query
+        """
+        chunks = self.__get_chunks()
         if cost_callback:
             # cost_callback(estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=self.documents))
             cost_callback(estimate_embedding_cost(model=AZURE_EMBEDDING_MODEL, docs=self.documents))
-        relevant_docs = await asyncio.to_thread(compressed_docs.invoke, query)
-        return self.__pretty_docs_list(relevant_docs, max_results)
+        if not chunks or not queries:
+            return [[] for _ in queries]
+
+        chunk_vectors, *query_vectors = await asyncio.gather(
+            self.embeddings.aembed_documents(chunks.texts_of(range(len(chunks)))),
+            *[self.embeddings.aembed_query(query) for query in queries],
+        )
+        matrix = SimilarityMatrix()
+        matrix.add(chunk_vectors)
+        results = matrix.top_k(query_vectors, max_results, threshold=float(self.similarity_threshold))
+        return [self.__pretty_docs_list([chunks[row] for row in rows], max_results) for rows, _ in results]
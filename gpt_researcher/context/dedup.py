@@ -0,0 +1,136 @@
+import re
+import zlib
+
+import numpy as np
+
+# Mersenne prime the permutations hash modulo, small enough for products to fit in 64 bits
+MERSENNE_PRIME = (1 << 31) - 1
+WORD = re.compile(r"\w+")
+# Shingles hashed at once, bounds the (num_perm, block) matrix to a few MB however long the page
+SHINGLE_BLOCK = 4096
+
+
+class MinHasher:
+    """
+    MinHash signatures of texts over their word shingles. The share of equal positions
+    of two signatures estimates the Jaccard similarity of the texts' shingle sets.
+    """
+
+    def __init__(self, num_perm=128, shingle_size=5, seed=1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+        self.b = rng.integers(0, MERSENNE_PRIME, size=(num_perm, 1), dtype=np.uint64)
+
+    def shingles(self, text):
+        """Hashes of the text's overlapping word n-grams"""
+        words = WORD.findall(text.lower())
+        if len(words) < self.shingle_size:
+            words = [" ".join(words)] if words else []
+            size = 1
+        else:
+            size = self.shingle_size
+        return np.unique(np.fromiter(
+            (zlib.crc32(" ".join(words[i:i + size]).encode("utf-8")) & MERSENNE_PRIME
+             for i in range(len(words) - size + 1)),
+            dtype=np.uint64,
+        ))
+
+    def signature(self, text):
+        """
+        Args:
+            text: The text to sign
+
+        Returns:
+            np.ndarray: `num_perm` minimum hashes, None for a text without words
+        """
+        shingles = self.shingles(text)
+        if not len(shingles):
+            return None
+        signature = np.full(self.num_perm, MERSENNE_PRIME, dtype=np.uint64)
+        for start in range(0, len(shingles), SHINGLE_BLOCK):
+            block = shingles[start:start + SHINGLE_BLOCK]
+            np.minimum(signature, ((self.a * block + self.b) % MERSENNE_PRIME).min(axis=1), out=signature)
+        return signature
+
+
+class NearDuplicateIndex:
+    """
+    Run-scoped detector of near-duplicate pages (syndicated articles, mirrors, scraped
+    aggregators). Signatures are bucketed with locality-sensitive hashing, band by band,
+    so a page is only compared with the pages it shares a bucket with. A page whose
+    estimated similarity with an earlier one reaches the threshold collapses into it,
+    and the earlier page, the representative, keeps the urls of all its copies.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=16):
+        """
+        Initialize the NearDuplicateIndex class.
+        Args:
+            threshold: Estimated Jaccard similarity from which two pages are duplicates
+            num_perm: Length of the MinHash signatures
+            bands: Number of LSH bands, more bands find less similar candidates
+        """
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets = {}
+        self._signatures = {}
+        # Page key -> key of its representative
+        self._representatives = {}
+        # Representative key -> urls of the page and its duplicates
+        self.sources = {}
+        self.duplicates = 0
+
+    def __contains__(self, key):
+        return key in self._representatives
+
+    def add(self, key, page, signature=None):
+        """
+        Registers a page, unless it duplicates one registered before.
+        Args:
+            key: Unique key of the page
+            page: The page ({"url", "raw_content"})
+            signature: The page's MinHash signature when it was computed beforehand, e.g.
+                outside the event loop
+
+        Returns:
+            str: The key of the page's representative, the page's own key if it is new
+        """
+        if key in self._representatives:
+            return self._representatives[key]
+
+        if signature is None:
+            signature = self.hasher.signature(page.get("raw_content", ""))
+        representative = self._find(signature) if signature is not None else None
+        url = page.get("url", "")
+        if representative is None:
+            representative = key
+            self.sources[key] = [url]
+            if signature is not None:
+                self._signatures[key] = signature
+                for band in self._bands(signature):
+                    self._buckets.setdefault(band, []).append(key)
+        else:
+            self.duplicates += 1
+            if url not in self.sources[representative]:
+                self.sources[representative].append(url)
+        self._representatives[key] = representative
+        return representative
+
+    def _bands(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def _find(self, signature):
+        candidates = dict.fromkeys(
+            key for band in self._bands(signature) for key in self._buckets.get(band, ())
+        )
+        best, best_similarity = None, self.threshold
+        for key in candidates:
+            similarity = float(np.mean(self._signatures[key] == signature))
+            if similarity >= best_similarity:
+                best, best_similarity = key, similarity
+        return best
@@ -0,0 +1,212 @@
+import asyncio
+import hashlib
+import os
+
+import numpy as np
+
+from gpt_researcher.context.chunking import ChunkStore
+from gpt_researcher.context.dedup import NearDuplicateIndex
+from gpt_researcher.context.similarity import SimilarityMatrix
+from gpt_researcher.utils.costs import estimate_embedding_cost
+from gpt_researcher.memory.embeddings import AZURE_EMBEDDING_MODEL
+
+
+class ContextIndex:
+    """
+    Run-scoped index of page chunks and their embeddings.
+
+    Every page is split and embedded once, the first time any sub-query hands it in,
+    and every sub-query is then answered against the stored vectors. Only the query
+    itself is embedded per sub-query. Near-duplicates of an indexed page are not
+    embedded at all, they share the chunks of the first copy, which cites every url.
+    """
+
+    def __init__(self, embeddings, similarity_threshold=None, duplicate_threshold=0.8, chunker=None):
+        self.embeddings = embeddings
+        self.similarity_threshold = float(
+            similarity_threshold if similarity_threshold is not None
+            else os.environ.get("SIMILARITY_THRESHOLD", 0.38)
+        )
+        # Disabled with a threshold of 0
+        self.duplicates = NearDuplicateIndex(duplicate_threshold) if duplicate_threshold > 0 else None
+        # Chunks are spans into the pages' text, only sliced out to embed and render them
+        self.chunks = ChunkStore(chunker)
+        self.matrix = SimilarityMatrix()
+        # Page key -> rows of its chunks in the matrix
+        self.page_rows = {}
+        # Page key -> task indexing that page, shared by every sub-query that needs it
+        self._pages = {}
+
+    @staticmethod
+    def page_key(page):
+        """Identifies a page by its url and content, urls alone are not unique for documents"""
+        digest = hashlib.sha1(page.get("raw_content", "").encode("utf-8")).hexdigest()
+        return f"{page.get('url', '')}#{digest}"
+
+    async def add_page(self, page, cost_callback=None, page_callback=None):
+        """
+        Splits and embeds a page, unless it or a near-duplicate of it is already indexed
+        or being indexed.
+        Args:
+            page: Scraped page ({"url", "raw_content"})
+            cost_callback: Callback for the embedding costs
+            page_callback: Callback called with the page once it is indexed
+
+        Returns:
+            str: The key of the page in the index, the key of the first copy for a duplicate
+        """
+        key = self.page_key(page)
+        if self.duplicates is not None:
+            signature = None
+            if key not in self.duplicates:
+                # Hashing a long page takes a while, keep it off the event loop
+                signature = await asyncio.to_thread(self.duplicates.hasher.signature, page.get("raw_content", ""))
+            key = self.duplicates.add(key, page, signature)
+        task = self._pages.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.__index_page(key, page, cost_callback))
+            self._pages[key] = task
+        # A sub-query giving up on a page must not cancel indexing for the others
+        await asyncio.shield(task)
+        if page_callback:
+            page_callback(page)
+        return key
+
+    async def add_pages(self, pages, cost_callback=None, page_callback=None):
+        """Indexes the pages concurrently and returns their keys"""
+        return await asyncio.gather(*[self.add_page(page, cost_callback, page_callback) for page in pages])
+
+    async def __index_page(self, key, page, cost_callback):
+        try:
+            spans = self.chunks.chunker.split(page.get("raw_content", ""))
+            if not spans:
+                return
+            text = page.get("raw_content", "")
+            if cost_callback:
+                cost_callback(estimate_embedding_cost(model=AZURE_EMBEDDING_MODEL, docs=[page]))
+            vectors = await self.embeddings.aembed_documents([text[start:end] for start, end in spans])
+        except Exception:
+            # Let a later sub-query retry the page
+            del self._pages[key]
+            raise
+
+        self.chunks.add_spans(
+            text, spans, {"title": page.get("title", ""), "source": page.get("url", ""), "page": key}
+        )
+        self.page_rows[key] = self.matrix.add(vectors)
+
+    def __top_rows(self, query_vector, page_keys, k):
+        rows = [self.page_rows[key] for key in dict.fromkeys(page_keys) if key in self.page_rows]
+        if not rows:
+            return np.empty(0, dtype=np.int64)
+        top_rows, _ = self.matrix.top_k(
+            [query_vector], k, threshold=self.similarity_threshold, rows=np.concatenate(rows)
+        )[0]
+        return top_rows
+
+    def __relevant_chunks(self, query_vector, page_keys, max_results):
+        return [self.chunks[row] for row in self.__top_rows(query_vector, page_keys, max_results)]
+
+    def __mirrors(self, doc):
+        if self.duplicates is None:
+            return ""
+        mirrors = self.duplicates.sources.get(doc.metadata.get("page"), [])[1:]
+        return f"Also published at: {', '.join(mirrors)}\n" if mirrors else ""
+
+    def __pretty_print_docs(self, docs):
+        return f"\n".join(f"Source: {d.metadata.get('source')}\n"
+                          f"{self.__mirrors(d)}"
+                          f"Title: {d.metadata.get('title')}\n"
+                          f"Content: {d.page_content}\n"
+                          for d in docs)
+
+    async def async_get_context(self, query, pages, max_results=5, cost_callback=None, page_callback=None):
+        """
+        Returns the chunks of the given pages that are most relevant to the query.
+        Args:
+            query: The query to compress the pages for
+            pages: List of scraped pages ({"url", "raw_content"})
+            max_results: Number of chunks to return
+            cost_callback: Callback for the embedding costs
+            page_callback: Callback called with every page once it is indexed
+
+        Returns:
+            str: The relevant chunks, formatted as context
+        """
+        page_keys, query_vector = await asyncio.gather(
+            self.add_pages(pages, cost_callback, page_callback),
+            self.embeddings.aembed_query(query),
+        )
+        return self.__pretty_print_docs(self.__relevant_chunks(query_vector, page_keys, max_results))
+
+    async def async_get_context_from_stream(self, query, pages, max_results=5, cost_callback=None,
+                                            tail_timeout=None, page_callback=None):
+        """
+        Same as `async_get_context`, for pages that are still being scraped. Every page is
+        indexed as soon as it arrives instead of waiting for the slowest url. Once
+        `max_results` chunks pass the similarity threshold, the remaining pages only get
+        `tail_timeout` seconds to arrive. Pages still being scraped or indexed then are
+        dropped and never reach `page_callback`.
+
+        Args:
+            query: The query to compress the pages for
+            pages: Async iterable of scraped pages ({"url", "raw_content"})
+            max_results: Number of chunks to return
+            cost_callback: Callback for the embedding costs
+            tail_timeout: Seconds to wait for more pages once enough relevant chunks exist,
+                None waits for every page
+            page_callback: Callback called with every page once it is indexed
+
+        Returns:
+            str: The relevant chunks, formatted as context
+        """
+        query_vector = await self.embeddings.aembed_query(query)
+        loop = asyncio.get_running_loop()
+        iterator = aiter(pages)
+
+        async def next_page():
+            return await anext(iterator)
+
+        page_keys = []
+        # Pages are indexed concurrently, while the next ones are still arriving
+        indexing = set()
+        receiving = asyncio.ensure_future(next_page())
+        deadline = None
+        try:
+            while receiving is not None or indexing:
+                waiting = indexing | {receiving} if receiving is not None else indexing
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait(waiting, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+
+                if receiving in done:
+                    try:
+                        page = receiving.result()
+                    except StopAsyncIteration:
+                        receiving = None
+                    else:
+                        indexing.add(asyncio.ensure_future(self.add_page(page, cost_callback, page_callback)))
+                        receiving = asyncio.ensure_future(next_page())
+
+                for task in done & indexing:
+                    indexing.remove(task)
+                    page_keys.append(task.result())
+
+                if deadline is None and tail_timeout is not None:
+                    if len(self.__top_rows(query_vector, page_keys, max_results)) >= max_results:
+                        deadline = loop.time() + tail_timeout
+
+            # Past the deadline, the pages that already arrived are still indexed
+            page_keys.extend(await asyncio.gather(*indexing))
+            indexing.clear()
+        finally:
+            if receiving is not None:
+                receiving.cancel()
+                await asyncio.gather(receiving, return_exceptions=True)
+            for task in indexing:
+                task.cancel()
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+
+        return self.__pretty_print_docs(self.__relevant_chunks(query_vector, page_keys, max_results))
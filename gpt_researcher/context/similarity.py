@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class SimilarityMatrix:
+    """
+    Contiguous float32 matrix of L2-normalized embeddings.
+
+    Rows are appended as chunks get embedded, and relevance is computed for any
+    number of queries with a single matrix multiplication. Top-k selection uses
+    argpartition, so only the k best rows of each query are ever sorted.
+    """
+
+    def __init__(self, capacity=1024):
+        self._matrix = None
+        self._capacity = capacity
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def normalize(vectors):
+        """Returns the vectors as a float32 matrix of unit rows"""
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+
+    def add(self, vectors):
+        """
+        Appends embeddings to the matrix.
+        Args:
+            vectors: List of embeddings
+
+        Returns:
+            np.ndarray: The row ids of the added embeddings
+        """
+        if len(vectors) == 0:
+            return np.empty(0, dtype=np.int64)
+        vectors = self.normalize(vectors)
+        if self._matrix is None:
+            self._matrix = np.empty((max(self._capacity, len(vectors)), vectors.shape[1]), dtype=np.float32)
+        elif self._size + len(vectors) > len(self._matrix):
+            # Grow geometrically so appends stay amortized O(1)
+            grown = np.empty((max(2 * len(self._matrix), self._size + len(vectors)), self._matrix.shape[1]),
+                             dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+        rows = np.arange(self._size, self._size + len(vectors))
+        self._matrix[rows] = vectors
+        self._size += len(vectors)
+        return rows
+
+    def scores(self, queries, rows=None):
+        """
+        Cosine similarity of every query against the given rows.
+        Args:
+            queries: List of query embeddings
+            rows: Row ids to score, all rows when None
+
+        Returns:
+            np.ndarray: (number of queries, number of rows) similarity matrix
+        """
+        matrix = self._matrix[:self._size] if rows is None else self._matrix[rows]
+        return self.normalize(queries) @ matrix.T
+
+    def top_k(self, queries, k, threshold=None, rows=None):
+        """
+        Best `k` rows of every query with a similarity strictly above `threshold`,
+        best first.
+        Args:
+            queries: List of query embeddings
+            k: Maximum number of rows per query
+            threshold: Minimum similarity, None keeps every row
+            rows: Row ids to search, all rows when None
+
+        Returns:
+            list: One (row ids, similarities) pair of arrays per query
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        row_ids = np.arange(self._size) if rows is None else np.asarray(rows, dtype=np.int64)
+        if self._size == 0 or len(row_ids) == 0 or k <= 0:
+            return [(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)) for _ in queries]
+
+        scores = self.scores(queries, row_ids)
+        if threshold is not None:
+            scores = np.where(scores > threshold, scores, -np.inf)
+
+        k = min(k, scores.shape[1])
+        if k < scores.shape[1]:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            top = np.broadcast_to(np.arange(k), (len(scores), k))
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind="stable")
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        results = []
+        for query_top, query_scores in zip(top, top_scores):
+            kept = np.isfinite(query_scores)
+            results.append((row_ids[query_top[kept]], query_scores[kept]))
+        return results
@@ -87,7 +87,9 @@ def get_retrievers(headers, cfg, report_source):
         cfg (Config): The configuration object
 
     Returns:
-        list: A list of retriever classes to be used for searching.
+        list: A list of retriever classes to be used for searching. Retrievers that
+        implement `asearch()` are searched natively async over the shared HTTP session,
+        the others through `search()` in a worker thread.
     """
 
     # Check headers first for multiple retrievers
@@ -261,7 +263,7 @@ async def get_sub_queries(
     return sub_queries
 
 
-def scrape_urls(urls, cfg=None):
+async def scrape_urls(urls, cfg=None):
     """
     Scrapes the urls
     Args:
@@ -273,18 +275,41 @@ def scrape_urls(urls, cfg=None):
 
     """
     content = []
-    user_agent = (
-        cfg.user_agent
-        if cfg
-        else "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0"
-    )
     try:
-        content = Scraper(urls, user_agent, cfg.scraper).run()
+        content = await Scraper.from_config(urls, cfg).run()
     except Exception as e:
         print(f"{Fore.RED}Error in scrape_urls: {e}{Style.RESET_ALL}")
     return content
 
 
+async def stream_scrape_urls(urls, cfg=None, pages=None, coordinator=None):
+    """
+    Scrapes the urls and yields every page as soon as it is scraped
+    Args:
+        urls: List of urls
+        cfg: Config (optional)
+        pages: Pages whose content is already known, yielded first without scraping
+        coordinator: ScrapeCoordinator of the research run (optional), to share scrapes
+            with the other sub-queries
+
+    Yields:
+        page: dict with the url and raw_content of the page
+
+    """
+    for page in pages or []:
+        yield page
+
+    if coordinator:
+        scraped_pages = coordinator.stream(urls)
+    else:
+        scraped_pages = Scraper.from_config(urls, cfg).stream()
+    try:
+        async for page in scraped_pages:
+            yield page
+    except Exception as e:
+        print(f"{Fore.RED}Error in stream_scrape_urls: {e}{Style.RESET_ALL}")
+
+
 # Deprecated: Instead of summaries using ContextualRetriever embedding.
 # This exists in case we decide to modify in the future
 async def summarize(
@@ -1,15 +1,23 @@
 import asyncio
-import random
 import time
 
-from typing import Set
-
 from gpt_researcher.config import Config
-from gpt_researcher.context.compression import ContextCompressor, WrittenContentCompressor, VectorstoreCompressor
+from gpt_researcher.context.chunking import SpanChunker
+from gpt_researcher.context.compression import WrittenContentCompressor, VectorstoreCompressor
+from gpt_researcher.context.index import ContextIndex
+from gpt_researcher.context.similarity import SimilarityMatrix
 from gpt_researcher.document import DocumentLoader, LangChainDocumentLoader
 from gpt_researcher.master.actions import *
 from gpt_researcher.memory import Memory
+from gpt_researcher.memory.cache import CachedEmbeddings
+from gpt_researcher.memory.embeddings import AZURE_EMBEDDING_MODEL
+from gpt_researcher.retrievers.cache import get_search_cache
+from gpt_researcher.retrievers.fusion import reciprocal_rank_fusion
+from gpt_researcher.scraper.concurrency import get_concurrency_controller
+from gpt_researcher.scraper.coordinator import ScrapeCoordinator
+from gpt_researcher.utils.costs import estimate_embedding_cost
 from gpt_researcher.utils.enum import ReportSource, ReportType, Tone
+from gpt_researcher.utils.url import VisitedUrls, canonicalize_url
 
 
 class GPTResearcher:
@@ -33,7 +41,7 @@ class GPTResearcher:
         role=None,
         parent_query: str = "",
         subtopics: list = [],
-        visited_urls: set = set(),
+        visited_urls: set = None,
         verbose: bool = True,
         context=[],
         headers: dict = None,
@@ -55,7 +63,7 @@ class GPTResearcher:
             role
             parent_query: str
             subtopics: list
-            visited_urls: set
+            visited_urls: set or VisitedUrls
         """
         self.headers = headers or {}
         self.query: str = query
@@ -77,8 +85,19 @@ class GPTResearcher:
         self.documents = documents
         self.vector_store = vector_store
         self.vector_store_filter = vector_store_filter
-        self.memory = Memory(self.cfg.embedding_provider, self.headers)
-        self.visited_urls: set[str] = visited_urls
+        self.memory = Memory(
+            self.cfg.embedding_provider,
+            self.headers,
+            cache_path=self.cfg.embedding_cache_path,
+            cache_max_vectors=self.cfg.embedding_cache_max_vectors,
+        )
+        self.chunker = SpanChunker.from_config(self.cfg)
+        self.__reset_run_state()
+        # A registry handed in by a detailed report is shared with it, plain sets are copied
+        self.visited_urls: VisitedUrls = (
+            visited_urls if isinstance(visited_urls, VisitedUrls)
+            else VisitedUrls(visited_urls, bloom_capacity=self.cfg.visited_urls_bloom_capacity)
+        )
         self.verbose: bool = verbose
         self.websocket = websocket
         self.headers = headers or {}
@@ -101,12 +120,25 @@ class GPTResearcher:
         self.include_domains = include_domains
         self.search_query_instructions = search_query_instructions
 
+    def __reset_run_state(self):
+        """
+        Starts a fresh context index and scrape coordinator. Pages are scraped, chunked and
+        embedded once per research task, for all sub-queries
+        """
+        self.context_index = ContextIndex(
+            self.memory.get_embeddings(),
+            duplicate_threshold=self.cfg.near_duplicate_threshold,
+            chunker=self.chunker,
+        )
+        self.scrape_coordinator = ScrapeCoordinator(self.cfg)
+
     async def conduct_research(self):
         """
         Runs the GPT Researcher to conduct research
         """
         # Reset visited_urls and source_urls at the start of each research task
         self.visited_urls.clear()
+        self.__reset_run_state()
         # Due to deprecation of report_type in favor of report_source,
         # we need to clear source_urls if report_source is not static
         if self.report_source != "static" and self.report_type != "sources":
@@ -168,6 +200,30 @@ class GPTResearcher:
             self.context = await self.__get_context_by_search(self.query, include_domains=self.include_domains)
 
         time.sleep(2)
+        embeddings = self.memory.get_embeddings()
+        if self.verbose and isinstance(embeddings, CachedEmbeddings):
+            await stream_output(
+                "logs",
+                "embedding_cache",
+                f"💾 Embedding cache: {embeddings.hits} hits, {embeddings.misses} misses",
+                self.websocket,
+            )
+        if self.verbose and self.context_index.duplicates is not None:
+            await stream_output(
+                "logs",
+                "near_duplicates",
+                f"🧬 Skipped {self.context_index.duplicates.duplicates} near-duplicate pages",
+                self.websocket,
+            )
+        if self.verbose:
+            concurrency = get_concurrency_controller(self.cfg).stats()
+            await stream_output(
+                "logs",
+                "scraper_concurrency",
+                f"🚦 Scraper concurrency: window {concurrency['window']}, "
+                f"timeout {concurrency['request_timeout']}s, {concurrency['failures']} failed requests",
+                self.websocket,
+            )
         if self.verbose:
             await stream_output(
                 "logs",
@@ -244,8 +300,10 @@ class GPTResearcher:
                 self.websocket,
             )
 
-        scraped_sites = scrape_urls(new_search_urls, self.cfg)
-        return await self.__get_similar_content_by_query(self.query, scraped_sites)
+        scraped_sites = await scrape_urls(new_search_urls, self.cfg)
+        return await self.__get_similar_content_by_query(
+            self.query, scraped_sites, page_callback=self.__add_source_url
+        )
 
     async def __get_context_by_vectorstore(self, query, filter: Optional[dict] = None):
         """
@@ -401,10 +459,15 @@ class GPTResearcher:
                 self.websocket,
             )
 
-        if not scraped_data:
-            scraped_data = await self.__scrape_data_by_query(sub_query, include_domains)
-
-        content = await self.__get_similar_content_by_query(sub_query, scraped_data)
+        if scraped_data:
+            content = await self.__get_similar_content_by_query(sub_query, scraped_data)
+        else:
+            new_search_urls, retrieved_pages = await self.__search_new_urls_by_query(sub_query, include_domains)
+            content = await self.__get_similar_content_by_stream(
+                sub_query, stream_scrape_urls(
+                    new_search_urls, self.cfg, pages=retrieved_pages, coordinator=self.scrape_coordinator
+                )
+            )
 
         if content and self.verbose:
             await stream_output(
@@ -471,9 +534,11 @@ class GPTResearcher:
         retriever = self.retriever(sub_query)
 
         # Perform the search using the current retriever
-        search_results = await asyncio.to_thread(
-            retriever.search, max_results=self.cfg.max_search_results_per_query, base_id=self.base_id, agent_id=self.agent_id
-        )
+        search_params = dict(max_results=self.cfg.max_search_results_per_query, base_id=self.base_id, agent_id=self.agent_id)
+        if hasattr(retriever, "asearch"):
+            search_results = await retriever.asearch(**search_params)
+        else:
+            search_results = await asyncio.to_thread(retriever.search, **search_params)
 
         # Log the research process if verbose mode is on
         if self.verbose:
@@ -497,8 +562,7 @@ class GPTResearcher:
 
         new_urls = []
         for url in url_set_input:
-            if url not in self.visited_urls:
-                self.visited_urls.add(url)
+            if self.visited_urls.add(url):
                 new_urls.append(url)
                 if self.verbose:
                     await stream_output(
@@ -512,35 +576,48 @@ class GPTResearcher:
 
         return new_urls
 
-    async def __scrape_data_by_query(self, sub_query, include_domains=None):
+    async def __search_new_urls_by_query(self, sub_query, include_domains=None):
         """
-        Runs a sub-query across multiple retrievers and scrapes the resulting URLs.
+        Runs a sub-query across multiple retrievers and picks the best URLs to scrape for it.
 
         Args:
             sub_query (str): The sub-query to search for.
 
         Returns:
-            list: A list of scraped content results.
+            tuple: The URLs to scrape, and the pages ({"url", "raw_content"}) of the URLs
+            whose content the retrievers already returned.
         """
-        new_search_urls = []
-
-        # Iterate through all retrievers
-        for retriever_class in self.retrievers:
-            # Instantiate the retriever with the sub-query
-            retriever = retriever_class(sub_query)
-
-            # Perform the search using the current retriever
-            search_results = await asyncio.to_thread(
-                retriever.search, max_results=self.cfg.max_search_results_per_query, search_depth="basic", include_domains=include_domains, base_id=self.base_id, agent_id=self.agent_id
-            )
-
-            # Collect new URLs from search results
-            search_urls = [url.get("href") for url in search_results]
-            new_search_urls.extend(search_urls)
+        # Query all retrievers concurrently, a slow or failing one only loses its own results
+        all_search_results = await asyncio.gather(
+            *[
+                self.__search_with_retriever(retriever_class, sub_query, include_domains)
+                for retriever_class in self.retrievers
+            ]
+        )
 
-        # Get unique URLs
-        new_search_urls = await self.__get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
+        # Rank URLs by how well all retrievers agree on them and only scrape the best ones
+        fused_urls = reciprocal_rank_fusion(
+            [[result.get("href") for result in search_results if result.get("href")]
+             for search_results in all_search_results]
+        )
+        fused_urls = await self.__triage_urls_by_snippet(sub_query, fused_urls, all_search_results)
+        new_search_urls = fused_urls[:self.cfg.max_scrape_urls_per_query]
+        # Pages another sub-query of this run already picked are still used, the scrape
+        # coordinator shares them instead of fetching them again
+        await self.__get_new_urls(new_search_urls)
+
+        # Results that already carry the page text go straight to compression
+        raw_contents = {}
+        for search_results in all_search_results:
+            for result in search_results:
+                raw_content = result.get("raw_content")
+                if raw_content and len(raw_content) >= self.cfg.retriever_content_min_length:
+                    raw_contents.setdefault(canonicalize_url(result["href"]), raw_content)
+        retrieved_pages = [
+            {"url": url, "raw_content": raw_contents[canonicalize_url(url)]}
+            for url in new_search_urls if canonicalize_url(url) in raw_contents
+        ]
+        new_search_urls = [url for url in new_search_urls if canonicalize_url(url) not in raw_contents]
 
         # Log the research process if verbose mode is on
         if self.verbose:
@@ -551,13 +628,104 @@ class GPTResearcher:
                 self.websocket,
             )
 
-        # Scrape the new URLs
-        scraped_content_results = await asyncio.to_thread(
-            scrape_urls, new_search_urls, self.cfg
+        return new_search_urls, retrieved_pages
+    
+    async def __triage_urls_by_snippet(self, sub_query, urls, all_search_results):
+        """
+        Drops the URLs whose search snippet is not similar enough to the sub-query, before
+        anything gets fetched. URLs without a snippet are kept, there is nothing to judge.
+
+        Args:
+            sub_query (str): The sub-query the URLs were found for.
+            urls (list): The candidate URLs, best first.
+            all_search_results (list): The search results of every retriever.
+
+        Returns:
+            list: The promising URLs, in their original order.
+        """
+        threshold = self.cfg.snippet_similarity_threshold
+        snippets = {}
+        for search_results in all_search_results:
+            for result in search_results:
+                if result.get("href") and result.get("body"):
+                    snippets.setdefault(canonicalize_url(result["href"]), result["body"])
+        judged = [url for url in urls if canonicalize_url(url) in snippets]
+        if threshold <= 0 or not judged:
+            return urls
+
+        texts = [snippets[canonicalize_url(url)] for url in judged]
+        embeddings = self.memory.get_embeddings()
+        try:
+            vectors, query_vector = await asyncio.gather(
+                embeddings.aembed_documents(texts), embeddings.aembed_query(sub_query)
+            )
+        except Exception as e:
+            print(f"Snippet triage failed for '{sub_query}', scraping every URL: {e}")
+            return urls
+        self.add_costs(estimate_embedding_cost(model=AZURE_EMBEDDING_MODEL, docs=texts))
+
+        matrix = SimilarityMatrix(capacity=len(vectors))
+        matrix.add(vectors)
+        scores = matrix.scores([query_vector])[0]
+        dropped = {url for url, score in zip(judged, scores) if score < threshold}
+        if dropped and self.verbose:
+            await stream_output(
+                "logs",
+                "triage",
+                f"🗑️ Skipping {len(dropped)} of {len(urls)} sources whose snippets do not match '{sub_query}'\n",
+                self.websocket,
+            )
+        return [url for url in urls if url not in dropped]
+
+    async def __search_with_retriever(self, retriever_class, sub_query, include_domains=None):
+        """
+        Runs a sub-query with a single retriever, giving up after the configured timeout.
+
+        Args:
+            retriever_class: The retriever to search with.
+            sub_query (str): The sub-query to search for.
+
+        Returns:
+            list: The search results, empty if the retriever failed or timed out.
+        """
+        search_params = dict(
+            max_results=self.cfg.max_search_results_per_query, search_depth="basic", include_domains=include_domains, base_id=self.base_id, agent_id=self.agent_id
         )
+        search_cache = get_search_cache(self.cfg)
+        if search_cache:
+            cache_key = search_cache.key(retriever_class.__name__, sub_query, **search_params)
+            search_results = search_cache.get(cache_key)
+            if search_results is not None:
+                return search_results
+
+        try:
+            # Instantiate the retriever with the sub-query
+            retriever = retriever_class(sub_query)
+
+            # Perform the search using the current retriever, natively async retrievers
+            # share the pooled HTTP session instead of taking a thread per search
+            if hasattr(retriever, "asearch"):
+                search = retriever.asearch(**search_params)
+            else:
+                search = asyncio.to_thread(retriever.search, **search_params)
+            search_results = await asyncio.wait_for(search, timeout=self.cfg.retriever_timeout)
+        except asyncio.TimeoutError:
+            print(f"{retriever_class.__name__} timed out after {self.cfg.retriever_timeout}s for '{sub_query}', continuing without it.")
+            return []
+        except Exception as e:
+            print(f"{retriever_class.__name__} failed for '{sub_query}': {e}")
+            return []
+
+        # Retrievers returning documents rather than search hits name the link "url"
+        for result in search_results or []:
+            if not result.get("href") and result.get("url"):
+                result["href"] = result["url"]
+
+        # Empty results are usually transient failures, so only real results are cached
+        if search_cache and search_results:
+            search_cache.put(cache_key, search_results)
+        return search_results or []
 
-        return scraped_content_results
-    
     async def __get_context_by_search_splore(self, query, scraped_data: list = []):
         """
            Generates the context for the research task by searching the query and scraping the results
@@ -615,7 +783,11 @@ class GPTResearcher:
             query=query, max_results=8
         )
 
-    async def __get_similar_content_by_query(self, query, pages):
+    def __add_source_url(self, page):
+        """Lists the url of a page that made it into the index as a source of the report"""
+        self.visited_urls.add_source(page.get("url", ""))
+
+    async def __get_similar_content_by_query(self, query, pages, page_callback=None):
         if self.verbose:
             await stream_output(
                 "logs",
@@ -624,13 +796,28 @@ class GPTResearcher:
                 self.websocket,
             )
 
-        # Summarize Raw Data
-        context_compressor = ContextCompressor(
-            documents=pages, embeddings=self.memory.get_embeddings()
+        # Pages are only embedded the first time a sub-query hands them in
+        return await self.context_index.async_get_context(
+            query=query, pages=pages, max_results=8, cost_callback=self.add_costs, page_callback=page_callback
         )
-        # Run Tasks
-        return await context_compressor.async_get_context(
-            query=query, max_results=8, cost_callback=self.add_costs
+
+    async def __get_similar_content_by_stream(self, query, pages):
+        if self.verbose:
+            await stream_output(
+                "logs",
+                "fetching_query_content",
+                f"📚 Getting relevant content based on query: {query}...",
+                self.websocket,
+            )
+
+        # Index pages while the remaining ones are still being scraped
+        return await self.context_index.async_get_context_from_stream(
+            query=query,
+            pages=pages,
+            max_results=8,
+            cost_callback=self.add_costs,
+            tail_timeout=self.cfg.scrape_tail_timeout,
+            page_callback=self.__add_source_url,
         )
 
     ########################################################################################
@@ -730,40 +917,43 @@ class GPTResearcher:
 
         return draft_section_titles
     
-    async def __get_similar_written_contents_by_query(self,
-            query: str,
+    async def __get_similar_written_contents_by_queries(self,
+            queries: List[str],
             written_contents: List[Dict],
             similarity_threshold: float = 0.5,
             max_results: int = 10
-        ) -> List[str]:
+        ) -> List[List[str]]:
         """
-        Asynchronously retrieves similar written contents based on a given query.
+        Asynchronously retrieves similar written contents for several queries at once.
 
         Args:
-            query (str): The query to search for similar written contents.
+            queries (List[str]): The queries to search for similar written contents.
             written_contents (List[Dict]): List of written contents to search through.
             similarity_threshold (float, optional): The minimum similarity score for content to be considered relevant. 
                                                     Defaults to 0.5.
-            max_results (int, optional): The maximum number of similar contents to return. Defaults to 10.
+            max_results (int, optional): The maximum number of similar contents to return per query. Defaults to 10.
 
         Returns:
-            List[str]: A list of similar written contents, limited by max_results.
+            List[List[str]]: The similar written contents of each query, limited by max_results.
         """
         if self.verbose:
-            await stream_output(
-                "logs",
-                "fetching_relevant_written_content",
-                f"🔎 Getting relevant written content based on query: {query}...",
-                self.websocket,
-            )
-
-        # Retrieve similar written contents based on the query
+            for query in queries:
+                await stream_output(
+                    "logs",
+                    "fetching_relevant_written_content",
+                    f"🔎 Getting relevant written content based on query: {query}...",
+                    self.websocket,
+                )
+
+        # Retrieve similar written contents based on the queries
         # Use a higher similarity threshold to ensure more relevant results and reduce irrelevant matches
+        # The written contents are embedded once and scored against all queries together
         written_content_compressor = WrittenContentCompressor(
-            documents=written_contents, embeddings=self.memory.get_embeddings(), similarity_threshold=similarity_threshold
+            documents=written_contents, embeddings=self.memory.get_embeddings(), similarity_threshold=similarity_threshold,
+            chunker=self.chunker,
         )
-        return await written_content_compressor.async_get_context(
-            query=query, max_results=max_results, cost_callback=self.add_costs
+        return await written_content_compressor.async_get_contexts(
+            queries=queries, max_results=max_results, cost_callback=self.add_costs
         )
 
     async def __get_sub_queries(self, query):
@@ -797,13 +987,10 @@ class GPTResearcher:
         List[str]: List of relevant written contents.
         """
         all_queries = [current_subtopic] + draft_section_titles
-        
-        async def process_query(query: str) -> Set[str]:
-            return set(await self.__get_similar_written_contents_by_query(query, written_contents))
 
-        # Run all queries in parallel
-        results = await asyncio.gather(*[process_query(query) for query in all_queries])
-        
+        # Score all queries in one pass
+        results = await self.__get_similar_written_contents_by_queries(all_queries, written_contents)
+
         # Combine all results
         relevant_contents = set().union(*results)
 
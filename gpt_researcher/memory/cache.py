@@ -0,0 +1,293 @@
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class EmbeddingStore:
+    """
+    Persistent store of embedding vectors addressed by content hash.
+
+    Vectors live in a memory-mapped float32 file, one row per vector, so reading a
+    cached vector does not load the whole store. The key -> row index is kept in
+    SQLite; once `max_vectors` rows are in use, the least recently used row is
+    overwritten.
+
+    Several processes may share the files. Rows are allocated in a write-locked SQLite
+    transaction from the index as it is on disk, and every row carries a fingerprint of
+    its key in a second memory-mapped file, so a row overwritten by another process is
+    read as a miss instead of as the wrong vector.
+    """
+
+    # Access times collected before they are written without waiting for the next put
+    USED_BATCH = 256
+
+    def __init__(self, path, max_vectors=100000):
+        """
+        Initialize the EmbeddingStore class.
+        Args:
+            path: Path prefix of the store files
+            max_vectors: Maximum number of vectors kept
+        """
+        self.vectors_path = f"{path}.f32"
+        self.keys_path = f"{path}.keys"
+        self.max_vectors = max_vectors
+        self._lock = threading.Lock()
+        # Key -> last access time, not written yet
+        self._used = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Autocommit, transactions are opened explicitly
+        self._conn = sqlite3.connect(f"{path}.sqlite3", check_same_thread=False, isolation_level=None, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (dim INTEGER NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, slot INTEGER NOT NULL, used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS vectors_lru ON vectors (used)")
+
+        self.dim = self._read_dim()
+        self._capacity = 0
+        self._matrix = None
+        self._fingerprints = None
+        self._open()
+
+    @staticmethod
+    def fingerprint(key):
+        """Fingerprint of a key stored next to its vector, never 0"""
+        return int(key[:16], 16) | 1
+
+    def _read_dim(self):
+        row = self._conn.execute("SELECT dim FROM meta").fetchone()
+        return row[0] if row else None
+
+    def _open(self):
+        # Maps the rows the files hold now, other processes may have grown them
+        if not self.dim or not os.path.exists(self.vectors_path):
+            return
+        capacity = os.path.getsize(self.vectors_path) // (self.dim * 4)
+        if capacity == self._capacity and self._matrix is not None:
+            return
+        if not os.path.exists(self.keys_path) or os.path.getsize(self.keys_path) < capacity * 8:
+            with open(self.keys_path, "ab") as f:
+                f.truncate(capacity * 8)
+        self._capacity = capacity
+        self._matrix = np.memmap(
+            self.vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim)
+        )
+        self._fingerprints = np.memmap(self.keys_path, dtype=np.uint64, mode="r+", shape=(capacity,))
+
+    def _grow(self, slot):
+        # Called with the database write lock held, so no other process grows the files meanwhile
+        self._open()
+        if slot < self._capacity:
+            return
+        capacity = min(max(self._capacity * 2, 1024, slot + 1), self.max_vectors)
+        if self._matrix is not None:
+            self._matrix.flush()
+            self._fingerprints.flush()
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(capacity * self.dim * 4)
+        with open(self.keys_path, "ab") as f:
+            f.truncate(capacity * 8)
+        self._open()
+
+    def get_many(self, keys):
+        """
+        Looks up vectors by key. Blocking, call it from a worker thread in async code.
+        Args:
+            keys: The content keys
+
+        Returns:
+            dict: key -> vector (list of floats) for every key found in the store
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        found = {}
+        with self._lock:
+            slots = self._select_slots(keys)
+            if slots:
+                self._open()
+            now = time.time()
+            for key, slot in slots:
+                if slot >= self._capacity:
+                    continue
+                vector = self._matrix[slot].tolist()
+                # Checked after the copy, a writer clears the fingerprint before the vector
+                if self._fingerprints[slot] == self.fingerprint(key):
+                    found[key] = vector
+                    self._used[key] = now
+            if len(self._used) >= self.USED_BATCH:
+                self._conn.execute("BEGIN")
+                self._write_used()
+                self._conn.execute("COMMIT")
+        return found
+
+    def put_many(self, items):
+        """
+        Stores vectors, evicting the least recently used ones when the store is full.
+        Blocking, call it from a worker thread in async code.
+        Args:
+            items: dict of key -> vector
+        """
+        with self._lock:
+            if not items:
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Recent accesses first, so they are not taken for the least recently used rows
+                self._write_used()
+                self.dim = self._read_dim()
+                if self.dim is None:
+                    self.dim = len(next(iter(items.values())))
+                    self._conn.execute("INSERT INTO meta VALUES (?)", (self.dim,))
+
+                keys = [key for key, vector in items.items() if len(vector) == self.dim]
+                stored = {key for key, _ in self._select_slots(keys)}
+                keys = [key for key in keys if key not in stored]
+
+                # Rows are allocated from the index on disk, which other processes write too
+                used, next_slot = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(MAX(slot), -1) + 1 FROM vectors"
+                ).fetchone()
+                free = list(range(next_slot, min(next_slot + len(keys), self.max_vectors)))
+                evicted = []
+                if len(free) < len(keys):
+                    evicted = self._conn.execute(
+                        "SELECT key, slot FROM vectors ORDER BY used LIMIT ?", (len(keys) - len(free),)
+                    ).fetchall()
+                    free += [slot for _, slot in evicted]
+                if free:
+                    self._grow(max(free))
+
+                now = time.time()
+                rows = []
+                for key, slot in zip(keys, free):
+                    self._fingerprints[slot] = 0
+                    self._matrix[slot] = items[key]
+                    self._fingerprints[slot] = self.fingerprint(key)
+                    rows.append((key, slot, now))
+                if rows:
+                    self._matrix.flush()
+                    self._fingerprints.flush()
+
+                self._conn.executemany("DELETE FROM vectors WHERE key = ?", [(key,) for key, _ in evicted])
+                self._conn.executemany("INSERT OR REPLACE INTO vectors VALUES (?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _select_slots(self, keys):
+        # In batches, SQLite limits the number of query parameters
+        slots = []
+        for i in range(0, len(keys), 500):
+            batch = keys[i:i + 500]
+            slots += self._conn.execute(
+                f"SELECT key, slot FROM vectors WHERE key IN ({','.join('?' * len(batch))})", batch
+            ).fetchall()
+        return slots
+
+    def _write_used(self):
+        if self._used:
+            self._conn.executemany(
+                "UPDATE vectors SET used = ? WHERE key = ?", [(used, key) for key, used in self._used.items()]
+            )
+            self._used.clear()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    Embeddings wrapper that only calls the provider for texts it has not embedded
+    before. Vectors are keyed by provider, model and a hash of the text.
+    """
+
+    def __init__(self, embeddings: Embeddings, store: EmbeddingStore, provider: str, model: str):
+        self.embeddings = embeddings
+        self.store = store
+        self.namespace = f"{provider}\0{model}"
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, kind, text):
+        return hashlib.sha256(f"{self.namespace}\0{kind}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, kind, texts):
+        keys = [self._key(kind, text) for text in texts]
+        found = self.store.get_many(keys)
+        # Unique texts the provider still has to embed
+        missing = list(dict.fromkeys(
+            (key, text) for key, text in zip(keys, texts) if key not in found
+        ))
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += len(missing)
+        return keys, found, missing
+
+    def _store(self, found, missing, vectors):
+        new = {key: vector for (key, _), vector in zip(missing, vectors)}
+        self.store.put_many(new)
+        found.update(new)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = self._lookup("document", texts)
+        if missing:
+            vectors = self.embeddings.embed_documents([text for _, text in missing])
+            self._store(found, missing, vectors)
+        return [found[key] for key in keys]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        # The store blocks on disk and on other processes' writes, keep it off the event loop
+        keys, found, missing = await asyncio.to_thread(self._lookup, "document", texts)
+        if missing:
+            vectors = await self.embeddings.aembed_documents([text for _, text in missing])
+            await asyncio.to_thread(self._store, found, missing, vectors)
+        return [found[key] for key in keys]
+
+    def embed_query(self, text: str) -> List[float]:
+        keys, found, missing = self._lookup("query", [text])
+        if missing:
+            self._store(found, missing, [self.embeddings.embed_query(text)])
+        return found[keys[0]]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, "query", [text])
+        if missing:
+            vector = await self.embeddings.aembed_query(text)
+            await asyncio.to_thread(self._store, found, missing, [vector])
+        return found[keys[0]]
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(cache_path, provider, model, max_vectors=100000):
+    """
+    Returns the process-wide store for the given provider and model, so every
+    researcher in the process shares the same files.
+    Args:
+        cache_path: Directory of the embedding cache
+        provider: Embedding provider name
+        model: Embedding model name
+        max_vectors: Maximum number of vectors kept
+
+    Returns:
+        EmbeddingStore: The store
+    """
+    # Vector sizes differ between models, so each model gets its own files
+    name = re.sub(r"[^\w.-]", "_", f"{provider}-{model}")
+    path = os.path.join(os.path.expanduser(cache_path), name)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = EmbeddingStore(path, max_vectors=max_vectors)
+        return _stores[path]
@@ -1,27 +1,32 @@
 from langchain_community.vectorstores import FAISS
 import os
 
+from .cache import CachedEmbeddings, get_embedding_store
+
 OPENAI_EMBEDDING_MODEL = os.environ.get("OPENAI_EMBEDDING_MODEL","text-embedding-3-small")
 AZURE_EMBEDDING_MODEL = os.environ.get("AZURE_EMBEDDING_MODEL","text-embedding-3-small")
 
 
 class Memory:
-    def __init__(self, embedding_provider, headers=None, **kwargs):
+    def __init__(self, embedding_provider, headers=None, cache_path=None, cache_max_vectors=100000, **kwargs):
         _embeddings = None
+        _model = None
         headers = headers or {}
         match embedding_provider:
             case "ollama":
                 from langchain_community.embeddings import OllamaEmbeddings
 
+                _model = os.environ["OLLAMA_EMBEDDING_MODEL"]
                 _embeddings = OllamaEmbeddings(
-                    model=os.environ["OLLAMA_EMBEDDING_MODEL"],
+                    model=_model,
                     base_url=os.environ["OLLAMA_BASE_URL"],
                 )
             case "custom":
                 from langchain_openai import OpenAIEmbeddings
 
+                _model = os.environ.get("OPENAI_EMBEDDING_MODEL", "custom")
                 _embeddings = OpenAIEmbeddings(
-                    model=os.environ.get("OPENAI_EMBEDDING_MODEL", "custom"),
+                    model=_model,
                     openai_api_key=headers.get(
                         "openai_api_key", os.environ.get("OPENAI_API_KEY", "custom")
                     ),
@@ -33,6 +38,7 @@ class Memory:
             case "openai":
                 from langchain_openai import OpenAIEmbeddings
 
+                _model = OPENAI_EMBEDDING_MODEL
                 _embeddings = OpenAIEmbeddings(
                     openai_api_key=headers.get("openai_api_key")
                     or os.environ.get("OPENAI_API_KEY"),
@@ -41,6 +47,7 @@ class Memory:
             case "azure_openai":
                 from langchain_openai import AzureOpenAIEmbeddings
 
+                _model = AZURE_EMBEDDING_MODEL
                 _embeddings = AzureOpenAIEmbeddings(
                     deployment=AZURE_EMBEDDING_MODEL
                 )
@@ -48,10 +55,20 @@ class Memory:
                 from langchain.embeddings import HuggingFaceEmbeddings
 
                 _embeddings = HuggingFaceEmbeddings()
+                _model = _embeddings.model_name
 
             case _:
                 raise Exception("Embedding provider not found.")
 
+        # Only call the provider for chunks that were never embedded before
+        if cache_path:
+            _embeddings = CachedEmbeddings(
+                _embeddings,
+                get_embedding_store(cache_path, embedding_provider, _model, cache_max_vectors),
+                provider=embedding_provider,
+                model=_model,
+            )
+
         self._embeddings = _embeddings
 
     def get_embeddings(self):
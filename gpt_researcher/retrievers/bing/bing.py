@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from gpt_researcher.utils.http import get_http_session
+
 
 class BingSearch():
     """
@@ -40,7 +42,30 @@ class BingSearch():
         print("Searching with query {0}...".format(self.query))
         """Useful for general internet search queries using the Bing API."""
 
+        url, headers, params = self._request(max_results, include_domains)
+        resp = requests.get(url, headers=headers, params=params)
+
+        # Preprocess the results
+        if resp is None:
+            return
+        return self._parse_results(resp.text)
+
+    async def asearch(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
 
+        url, headers, params = self._request(max_results, include_domains)
+        # aiohttp only accepts string query parameters, requests would send str() of them too
+        params = {key: str(value) for key, value in params.items()}
+        async with get_http_session().get(url, headers=headers, params=params) as resp:
+            text = await resp.text()
+        return self._parse_results(text)
+
+    def _request(self, max_results, include_domains):
         # Search the query
         url = "https://api.bing.microsoft.com/v7.0/search"
 
@@ -62,14 +87,12 @@ class BingSearch():
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
-        
-        resp = requests.get(url, headers=headers, params=params)
+        return url, headers, params
 
-        # Preprocess the results
-        if resp is None:
-            return
+    @staticmethod
+    def _parse_results(text):
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
             results = search_results["webPages"]["value"]
         except Exception:
             return
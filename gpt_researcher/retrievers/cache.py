@@ -0,0 +1,83 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class SearchResultCache:
+    """
+    In-memory cache of retriever results shared by every researcher in the process.
+
+    Results are keyed by retriever, normalized query and the search parameters, so
+    identical sub-queries from the multi-agent editor, detailed report subtopics or
+    repeated user queries only reach the search API once per `ttl` seconds. At most
+    `max_entries` results are kept, least recently used first out.
+    """
+
+    def __init__(self, ttl=3600, max_entries=1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(retriever_name, query, max_results=None, include_domains=None, **params):
+        """
+        Builds the cache key of a search.
+        Args:
+            retriever_name: Name of the retriever class
+            query: The search query
+            max_results: Number of results requested
+            include_domains: Domains the search is restricted to
+            **params: Any other parameter the results depend on
+
+        Returns:
+            tuple: The cache key
+        """
+        normalized_query = " ".join(query.lower().split())
+        domains = tuple(sorted(include_domains)) if include_domains else ()
+        return (retriever_name, normalized_query, max_results, domains, tuple(sorted(params.items())))
+
+    def get(self, key):
+        """Returns a copy of the cached results, or None when missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, results = entry
+            if time.time() - stored_at >= self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return [dict(result) for result in results]
+
+    def put(self, key, results):
+        """Stores the results of a search"""
+        with self._lock:
+            self._entries[key] = (time.time(), [dict(result) for result in results])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_search_cache = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache(cfg):
+    """
+    Returns the process-wide search result cache.
+    Args:
+        cfg: Config
+
+    Returns:
+        SearchResultCache: The cache, or None when caching is disabled
+    """
+    global _search_cache
+    if cfg.search_cache_ttl <= 0:
+        return None
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = SearchResultCache(
+                ttl=cfg.search_cache_ttl, max_entries=cfg.search_cache_max_entries
+            )
+        return _search_cache
@@ -3,6 +3,10 @@ import requests
 import os
 import json
 
+import aiohttp
+
+from gpt_researcher.utils.http import get_http_session
+
 class CustomRetriever:
     """
     Custom API Retriever
@@ -59,6 +63,15 @@ class CustomRetriever:
         except requests.exceptions.RequestException as e:
             print(f"An error occurred: {e}")
             return None
+
+    async def amake_post_request(self, url, data):
+        try:
+            async with get_http_session().post(url, json=data) as response:
+                response.raise_for_status()  # Raise an exception for HTTP errors
+                return await response.json(content_type=None)  # Return the response as JSON
+        except aiohttp.ClientError as e:
+            print(f"An error occurred: {e}")
+            return None
     
     # def search(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
     #     """
@@ -123,36 +136,53 @@ class CustomRetriever:
             print("base_id or agent_id not found for custom search")
             return None
 
-        max_results = 5
         try:
-            try:
-                splore_url = os.environ["SPLORE_URL"]
-            except KeyError:
-                raise Exception("SPLORE_URL key not found. Please set the SPLORE_URL environment variable.")
-
-            data = {
+            response = self.make_post_request(self._splore_url(), {
                 "query": self.query,
                 "base_id": base_id,
                 "agent_id": agent_id
-            }
+            })
+            return self._parse_response(response)
+        
+        except requests.RequestException as e:
+            print(f"Failed to retrieve search results: {e}")
+            return None
 
-            response = self.make_post_request(splore_url, data)
+    async def asearch(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
+        """
+        Same as `search`, without blocking the event loop.
+        """
+        if not base_id or not agent_id:
+            print("base_id or agent_id not found for custom search")
+            return None
 
-            print("**************** SPLORE Response **********", response)
+        response = await self.amake_post_request(self._splore_url(), {
+            "query": self.query,
+            "base_id": base_id,
+            "agent_id": agent_id
+        })
+        return self._parse_response(response)
 
-            if response and "docs" in response and isinstance(response["docs"], list) and len(response["docs"]) > 0:
-                response = response["docs"][:max_results]
-            else:
-                print("No documents found in the response.")
-                return None
+    @staticmethod
+    def _splore_url():
+        try:
+            return os.environ["SPLORE_URL"]
+        except KeyError:
+            raise Exception("SPLORE_URL key not found. Please set the SPLORE_URL environment variable.")
 
-            final_results = []
-            for doc in response:
-                result = {"url": doc["metadata"]["external_link"], "raw_content": doc["snippet"]}
-                final_results.append(result)
+    @staticmethod
+    def _parse_response(response, max_results=5):
+        print("**************** SPLORE Response **********", response)
 
-            return final_results
-        
-        except requests.RequestException as e:
-            print(f"Failed to retrieve search results: {e}")
-            return None
\ No newline at end of file
+        if response and "docs" in response and isinstance(response["docs"], list) and len(response["docs"]) > 0:
+            response = response["docs"][:max_results]
+        else:
+            print("No documents found in the response.")
+            return None
+
+        final_results = []
+        for doc in response:
+            result = {"url": doc["metadata"]["external_link"], "raw_content": doc["snippet"]}
+            final_results.append(result)
+
+        return final_results
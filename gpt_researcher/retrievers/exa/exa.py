@@ -38,7 +38,8 @@ class ExaSearch:
         return api_key
 
     def search(
-        self, max_results=10, use_autoprompt=False, search_type="neural", **filters
+        self, max_results=10, use_autoprompt=False, search_type="neural",
+        search_depth=None, base_id=None, agent_id=None, **filters
     ):
         """
         Searches the query using the Exa API.
@@ -46,12 +47,16 @@ class ExaSearch:
             max_results: The maximum number of results to return.
             use_autoprompt: Whether to use autoprompting.
             search_type: The type of search (e.g., "neural", "keyword").
+            search_depth, base_id, agent_id: Accepted for compatibility with the other
+                retrievers, unused by Exa.
             **filters: Additional filters (e.g., date range, domains).
         Returns:
             A list of search results.
         """
-        results = self.client.search(
+        # Ask for the page text along with the hits, so the pages do not need to be scraped
+        results = self.client.search_and_contents(
             self.query,
+            text=True,
             type=search_type,
             use_autoprompt=use_autoprompt,
             num_results=max_results,
@@ -59,7 +64,8 @@ class ExaSearch:
         )
 
         search_response = [
-            {"href": result.url, "body": result.text} for result in results.results
+            {"href": result.url, "body": (result.text or "")[:500], "raw_content": result.text}
+            for result in results.results
         ]
         return search_response
 
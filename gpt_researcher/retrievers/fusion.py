@@ -0,0 +1,33 @@
+from gpt_researcher.utils.url import canonicalize_url
+
+
+def reciprocal_rank_fusion(ranked_lists, k=60):
+    """
+    Merges the ranked url lists of several retrievers with reciprocal rank fusion.
+
+    Every url scores 1 / (k + rank) in each list it appears in, and urls are matched
+    on their canonical form, so a page ranked high by several retrievers comes first.
+    Args:
+        ranked_lists: One list of urls per retriever, best first
+        k: Damping constant, higher values flatten the difference between ranks
+
+    Returns:
+        list: The fused urls, best first. Each page is returned once, spelled as in its
+        best ranked occurrence.
+    """
+    scores = {}
+    best = {}
+    for ranked_urls in ranked_lists:
+        seen = set()
+        for rank, url in enumerate(ranked_urls, start=1):
+            key = canonicalize_url(url)
+            # A retriever listing the same page twice only counts once
+            if key in seen:
+                continue
+            seen.add(key)
+            scores[key] = scores.get(key, 0.0) + 1.0 / (k + rank)
+            if key not in best or rank < best[key][0]:
+                best[key] = (rank, url)
+
+    # sorted() is stable, so ties keep the order in which pages were first seen
+    return [best[key][1] for key in sorted(scores, key=scores.get, reverse=True)]
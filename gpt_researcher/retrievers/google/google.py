@@ -5,6 +5,8 @@ import os
 import requests
 import json
 
+from gpt_researcher.utils.http import get_http_session
+
 
 class GoogleSearch:
     """
@@ -57,13 +59,30 @@ class GoogleSearch:
         """
         """Useful for general internet search queries using the Google API."""
         print("Searching with query {0}...".format(self.query))
-        url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={self.query}&start=1"
-        resp = requests.get(url)
+        resp = requests.get(self._url())
 
         if resp is None:
             return
+        return self._parse_results(resp.text)
+
+    async def asearch(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        print("Searching with query {0}...".format(self.query))
+        async with get_http_session().get(self._url()) as resp:
+            text = await resp.text()
+        return self._parse_results(text)
+
+    def _url(self):
+        return f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={self.query}&start=1"
+
+    @staticmethod
+    def _parse_results(text):
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
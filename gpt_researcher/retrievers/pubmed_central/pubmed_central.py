@@ -3,6 +3,8 @@ import xml.etree.ElementTree as ET
 
 import requests
 
+from gpt_researcher.utils.http import get_http_session
+
 
 class PubMedCentralSearch:
     """
@@ -35,6 +37,9 @@ class PubMedCentralSearch:
             )
         return api_key
 
+    ESEARCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
+    EFETCH_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
+
     def search(self, max_results=10):
         """
         Searches the query using the PubMed Central API.
@@ -43,16 +48,7 @@ class PubMedCentralSearch:
         Returns:
             A list of search results.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi"
-        params = {
-            "db": "pmc",
-            "term": f"{self.query} AND free fulltext[filter]",
-            "retmax": max_results,
-            "usehistory": "y",
-            "api_key": self.api_key,
-            "retmode": "json",
-        }
-        response = requests.get(base_url, params=params)
+        response = requests.get(self.ESEARCH_URL, params=self._esearch_params(max_results))
 
         if response.status_code != 200:
             raise Exception(
@@ -63,64 +59,178 @@ class PubMedCentralSearch:
         ids = results["esearchresult"]["idlist"]
 
         search_response = []
-        for article_id in ids:
-            xml_content = self.fetch([article_id])
-            if self.has_body_content(xml_content):
-                article_data = self.parse_xml(xml_content)
-                if article_data:
-                    search_response.append(
-                        {
-                            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
-                            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
-                        }
-                    )
-
-            if len(search_response) >= max_results:
-                break
+        for start in range(0, len(ids), max_results):
+            for article in self.iter_articles(ids[start:start + max_results]):
+                search_result = self._search_result(article)
+                if search_result:
+                    search_response.append(search_result)
+                if len(search_response) >= max_results:
+                    return search_response
 
         return search_response
 
-    def fetch(self, ids):
+    async def asearch(self, max_results=10, search_depth=None, include_domains=None, exclude_domains=None,
+                      base_id=None, agent_id=None):
         """
-        Fetches the full text content for given article IDs.
+        Same as `search`, without blocking the event loop.
         Args:
-            ids: List of article IDs.
+            max_results: The maximum number of results to return.
         Returns:
-            XML content of the articles.
+            A list of search results.
         """
-        base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi"
-        params = {
+        async with get_http_session().get(self.ESEARCH_URL, params=self._esearch_params(max_results)) as response:
+            if response.status != 200:
+                raise Exception(
+                    f"Failed to retrieve data: {response.status} - {await response.text()}"
+                )
+            results = await response.json(content_type=None)
+        ids = results["esearchresult"]["idlist"]
+
+        search_response = []
+        for start in range(0, len(ids), max_results):
+            articles = self.aiter_articles(ids[start:start + max_results])
+            try:
+                async for article in articles:
+                    search_result = self._search_result(article)
+                    if search_result:
+                        search_response.append(search_result)
+                    if len(search_response) >= max_results:
+                        return search_response
+            finally:
+                await articles.aclose()
+
+        return search_response
+
+    def _esearch_params(self, max_results):
+        return {
+            "db": "pmc",
+            "term": f"{self.query} AND free fulltext[filter]",
+            # Some articles have no body, ask for spare candidates to still fill max_results
+            "retmax": max_results * 2,
+            "usehistory": "y",
+            "api_key": self.api_key,
+            "retmode": "json",
+        }
+
+    def _efetch_params(self, ids):
+        return {
             "db": "pmc",
             "id": ",".join(ids),
             "retmode": "xml",
             "api_key": self.api_key,
         }
-        response = requests.get(base_url, params=params)
+
+    def _search_result(self, article):
+        article_id = self.article_id(article)
+        if not article_id or not self.has_body_content(article):
+            return None
+        article_data = self.parse_article(article)
+        return {
+            "href": f"https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{article_id}/",
+            "body": f"{article_data['title']}\n\n{article_data['abstract']}\n\n{article_data['body'][:500]}...",
+        }
+
+    def fetch(self, ids):
+        """
+        Fetches the full text content for given article IDs.
+        Args:
+            ids: List of article IDs.
+        Returns:
+            XML content of the articles.
+        """
+        response = self._efetch(ids)
+        return response.text
+
+    def iter_articles(self, ids):
+        """
+        Fetches the given article IDs in a single request and yields every article
+        element while the response is still being parsed, so callers can stop early.
+        Args:
+            ids: List of article IDs.
+        Yields:
+            The <article> elements, cleared again once the caller moves on.
+        """
+        with self._efetch(ids, stream=True) as response:
+            response.raw.decode_content = True
+            root = None
+            for event, elem in ET.iterparse(response.raw, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    continue
+                if elem.tag == "article":
+                    yield elem
+                    # Drop parsed articles so memory stays flat for large batches
+                    root.clear()
+
+    async def aiter_articles(self, ids):
+        """
+        Same as `iter_articles`, feeding the XML parser chunk by chunk from the shared
+        HTTP session.
+        Args:
+            ids: List of article IDs.
+        Yields:
+            The <article> elements, cleared again once the caller moves on.
+        """
+        async with get_http_session().get(self.EFETCH_URL, params=self._efetch_params(ids)) as response:
+            if response.status != 200:
+                raise Exception(
+                    f"Failed to retrieve data: {response.status} - {await response.text()}"
+                )
+            parser = ET.XMLPullParser(events=("start", "end"))
+            root = None
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        if root is None:
+                            root = elem
+                        continue
+                    if elem.tag == "article":
+                        yield elem
+                        # Drop parsed articles so memory stays flat for large batches
+                        root.clear()
+
+    def _efetch(self, ids, stream=False):
+        response = requests.get(self.EFETCH_URL, params=self._efetch_params(ids), stream=stream)
 
         if response.status_code != 200:
             raise Exception(
                 f"Failed to retrieve data: {response.status_code} - {response.text}"
             )
 
-        return response.text
+        return response
+
+    @staticmethod
+    def article_id(article):
+        """
+        Reads the PMC ID of an article element.
+        Args:
+            article: The <article> element.
+        Returns:
+            The numeric PMC ID, or None if the article does not list it.
+        """
+        for id_elem in article.iterfind(".//article-meta/article-id"):
+            if id_elem.get("pub-id-type") in ("pmc", "pmcid") and id_elem.text:
+                return id_elem.text.strip().removeprefix("PMC")
+        return None
 
     def has_body_content(self, xml_content):
         """
         Checks if the XML content has a body section.
         Args:
-            xml_content: XML content of the article.
+            xml_content: XML content of the article, or an already parsed <article> element.
         Returns:
             Boolean indicating presence of body content.
         """
-        root = ET.fromstring(xml_content)
+        article = self._article(xml_content)
+        if article is None:
+            return False
+
         ns = {
             "mml": "http://www.w3.org/1998/Math/MathML",
             "xlink": "http://www.w3.org/1999/xlink",
         }
-        article = root.find("article", ns)
-        if article is None:
-            return False
-
         body_elem = article.find(".//body", namespaces=ns)
         if body_elem is not None:
             return True
@@ -139,16 +249,24 @@ class PubMedCentralSearch:
         Returns:
             Dictionary containing title, abstract, and body text.
         """
-        root = ET.fromstring(xml_content)
+        article = self._article(xml_content)
+        if article is None:
+            return None
+        return self.parse_article(article)
+
+    def parse_article(self, article):
+        """
+        Extracts title, abstract, and body from a parsed <article> element.
+        Args:
+            article: The <article> element.
+        Returns:
+            Dictionary containing title, abstract, and body text.
+        """
         ns = {
             "mml": "http://www.w3.org/1998/Math/MathML",
             "xlink": "http://www.w3.org/1999/xlink",
         }
 
-        article = root.find("article", ns)
-        if article is None:
-            return None
-
         title = article.findtext(
             ".//title-group/article-title", default="", namespaces=ns
         )
@@ -171,3 +289,9 @@ class PubMedCentralSearch:
                         body.append(p.text.strip())
 
         return {"title": title, "abstract": abstract_text, "body": "\n".join(body)}
+
+    @staticmethod
+    def _article(xml_content):
+        if isinstance(xml_content, ET.Element):
+            return xml_content
+        return ET.fromstring(xml_content).find("article")
@@ -1,7 +1,10 @@
 from typing import Dict, List
 
+import aiohttp
 import requests
 
+from gpt_researcher.utils.http import get_http_session
+
 
 class SemanticScholarSearch:
     """
@@ -29,21 +32,44 @@ class SemanticScholarSearch:
         :param max_results: Maximum number of results to retrieve
         :return: List of dictionaries containing title, href, and body of each paper
         """
-        params = {
-            "query": self.query,
-            "limit": max_results,
-            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
-            "sort": self.sort,
-        }
-
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = requests.get(self.BASE_URL, params=self._params(max_results))
             response.raise_for_status()
         except requests.RequestException as e:
             print(f"An error occurred while accessing Semantic Scholar API: {e}")
             return []
 
-        results = response.json().get("data", [])
+        return self._parse_results(response.json())
+
+    async def asearch(self, max_results: int = 20, search_depth=None, include_domains=None, exclude_domains=None,
+                      base_id=None, agent_id=None) -> List[Dict[str, str]]:
+        """
+        Same as `search`, without blocking the event loop.
+
+        :param max_results: Maximum number of results to retrieve
+        :return: List of dictionaries containing title, href, and body of each paper
+        """
+        try:
+            async with get_http_session().get(self.BASE_URL, params=self._params(max_results)) as response:
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+        except aiohttp.ClientError as e:
+            print(f"An error occurred while accessing Semantic Scholar API: {e}")
+            return []
+
+        return self._parse_results(data)
+
+    def _params(self, max_results: int) -> Dict[str, str]:
+        return {
+            "query": self.query,
+            "limit": max_results,
+            "fields": "title,abstract,url,venue,year,authors,isOpenAccess,openAccessPdf",
+            "sort": self.sort,
+        }
+
+    @staticmethod
+    def _parse_results(data: Dict) -> List[Dict[str, str]]:
+        results = data.get("data", [])
         search_result = []
 
         for result in results:
@@ -5,6 +5,10 @@ import os
 import requests
 import urllib.parse
 
+import aiohttp
+
+from gpt_researcher.utils.http import get_http_session
+
 
 class SerpApiSearch():
     """
@@ -41,36 +45,61 @@ class SerpApiSearch():
         print("SerpApiSearch: Searching with query {0}...".format(self.query))
         """Useful for general internet search queries using SerpApi."""
 
-
-        url = "https://serpapi.com/search.json"
-        params = {
-            "q": self.query,
-            "api_key": self.api_key
-        }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
         search_response = []
         try:
-            response = requests.get(encoded_url, timeout=10)
+            response = requests.get(self._url(), timeout=10)
             if response.status_code == 200:
-                search_results = response.json()
-                if search_results:
-                    results = search_results["organic_results"]
-                    results_processed = 0
-                    for result in results:
-                        # skip youtube results
-                        if "youtube.com" in result["link"]:
-                            continue
-                        if results_processed >= max_results:
-                            break
-                        search_result = {
-                            "title": result["title"],
-                            "href": result["link"],
-                            "body": result["snippet"],
-                        }
-                        search_response.append(search_result)
-                        results_processed += 1
+                search_response = self._parse_results(response.json(), max_results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
 
         return search_response
+
+    async def asearch(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
+        """
+        Searches the query without blocking the event loop
+        Returns:
+
+        """
+        print("SerpApiSearch: Searching with query {0}...".format(self.query))
+
+        search_response = []
+        try:
+            async with get_http_session().get(self._url(), timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    search_response = self._parse_results(await response.json(content_type=None), max_results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+
+        return search_response
+
+    def _url(self):
+        url = "https://serpapi.com/search.json"
+        params = {
+            "q": self.query,
+            "api_key": self.api_key
+        }
+        return url + "?" + urllib.parse.urlencode(params)
+
+    @staticmethod
+    def _parse_results(search_results, max_results):
+        search_response = []
+        if search_results:
+            results = search_results["organic_results"]
+            results_processed = 0
+            for result in results:
+                # skip youtube results
+                if "youtube.com" in result["link"]:
+                    continue
+                if results_processed >= max_results:
+                    break
+                search_result = {
+                    "title": result["title"],
+                    "href": result["link"],
+                    "body": result["snippet"],
+                }
+                search_response.append(search_result)
+                results_processed += 1
+        return search_response
@@ -5,6 +5,10 @@ import os
 import requests
 import json
 
+import aiohttp
+
+from gpt_researcher.utils.http import get_http_session
+
 
 class SerperSearch():
     """
@@ -41,7 +45,29 @@ class SerperSearch():
         print("Searching with query {0}...".format(self.query))
         """Useful for general internet search queries using the Serp API."""
 
+        url, headers, data = self._request(max_results)
+        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+
+        # Preprocess the results
+        if resp is None:
+            return
+        return self._parse_results(resp.text)
+
+    async def asearch(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
+        """
+        Searches the query without blocking the event loop
+        Returns:
 
+        """
+        print("Searching with query {0}...".format(self.query))
+
+        url, headers, data = self._request(max_results)
+        async with get_http_session().post(url, timeout=aiohttp.ClientTimeout(total=10), headers=headers,
+                                           data=data) as resp:
+            text = await resp.text()
+        return self._parse_results(text)
+
+    def _request(self, max_results):
         # Search the query (see https://serper.dev/playground for the format)
         url = "https://google.serper.dev/search"
 
@@ -50,14 +76,12 @@ class SerperSearch():
         'Content-Type': 'application/json'
         }
         data = json.dumps({"q": self.query, "num": max_results})
+        return url, headers, data
 
-        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
-
-        # Preprocess the results
-        if resp is None:
-            return
+    @staticmethod
+    def _parse_results(text):
         try:
-            search_results = json.loads(resp.text)
+            search_results = json.loads(text)
         except Exception:
             return
         if search_results is None:
@@ -6,6 +6,10 @@ from typing import Literal, Sequence, Optional
 import requests
 import json
 
+import aiohttp
+
+from gpt_researcher.utils.http import get_http_session
+
 
 class TavilySearch():
     """
@@ -56,8 +60,43 @@ class TavilySearch():
         """
         Internal search method to send the request to the API.
         """
+        data = self._request_data(query, search_depth, topic, days, max_results, include_domains, exclude_domains,
+                                  include_answer, include_raw_content, include_images, use_cache)
+
+        response = requests.post(self.base_url, data=json.dumps(data), headers=self.headers, timeout=100)
 
-        data = {
+        if response.status_code == 200:
+            return response.json()
+        else:
+            response.raise_for_status()  # Raises a HTTPError if the HTTP request returned an unsuccessful status code
+
+    async def _asearch(self,
+                       query: str,
+                       search_depth: Literal["basic", "advanced"] = "basic",
+                       topic: str = "general",
+                       days: int = 2,
+                       max_results: int = 5,
+                       include_domains: Sequence[str] = None,
+                       exclude_domains: Sequence[str] = None,
+                       include_answer: bool = False,
+                       include_raw_content: bool = False,
+                       include_images: bool = False,
+                       use_cache: bool = True,
+                       ) -> dict:
+        """
+        Same as `_search`, over the shared pooled HTTP session.
+        """
+        data = self._request_data(query, search_depth, topic, days, max_results, include_domains, exclude_domains,
+                                  include_answer, include_raw_content, include_images, use_cache)
+
+        async with get_http_session().post(self.base_url, json=data, headers=self.headers,
+                                           timeout=aiohttp.ClientTimeout(total=100)) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    def _request_data(self, query, search_depth, topic, days, max_results, include_domains, exclude_domains,
+                      include_answer, include_raw_content, include_images, use_cache):
+        return {
             "query": query,
             "search_depth": search_depth,
             "topic": topic,
@@ -72,28 +111,40 @@ class TavilySearch():
             "use_cache": use_cache,
         }
 
-        response = requests.post(self.base_url, data=json.dumps(data), headers=self.headers, timeout=100)
+    def search(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
+        """
+        Searches the query
+        Returns:
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            response.raise_for_status()  # Raises a HTTPError if the HTTP request returned an unsuccessful status code
+        """
+        try:
+            # Search the query
+            results = self._search(self.query, search_depth=search_depth, max_results=max_results, topic=self.topic, include_domains=include_domains, exclude_domains=exclude_domains, include_raw_content=True)
+            search_response = self._parse_results(results)
+        except Exception as e:
+            print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
+            search_response = []
+        return search_response
 
-    def search(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None):
+    async def asearch(self, max_results=7, search_depth=None, include_domains=None, exclude_domains=None, base_id=None, agent_id=None):
         """
-        Searches the query
+        Searches the query without blocking the event loop
         Returns:
 
         """
         try:
             # Search the query
-            results = self._search(self.query, search_depth=search_depth, max_results=max_results, topic=self.topic, include_domains=include_domains, exclude_domains=exclude_domains)
-            sources = results.get("results", [])
-            if not sources:
-                raise Exception("No results found with Tavily API search.")
-            # Return the results
-            search_response = [{"href": obj["url"], "body": obj["content"]} for obj in sources]
+            results = await self._asearch(self.query, search_depth=search_depth, max_results=max_results, topic=self.topic, include_domains=include_domains, exclude_domains=exclude_domains, include_raw_content=True)
+            search_response = self._parse_results(results)
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
         return search_response
+
+    @staticmethod
+    def _parse_results(results):
+        sources = results.get("results", [])
+        if not sources:
+            raise Exception("No results found with Tavily API search.")
+        # Return the results, with the page text so the page does not need to be scraped
+        return [{"href": obj["url"], "body": obj["content"], "raw_content": obj.get("raw_content")} for obj in sources]
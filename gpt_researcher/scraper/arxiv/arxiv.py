@@ -1,22 +1,204 @@
-from langchain_community.retrievers import ArxivRetriever
+import asyncio
+import re
+import threading
+from collections import OrderedDict
+
+import arxiv
+
+from gpt_researcher.scraper.download import read_body
+from gpt_researcher.scraper.pymupdf.pymupdf import PyMuPDFScraper
+from gpt_researcher.utils.http import get_http_session
+from gpt_researcher.utils.loops import get_loop_local
+
+# arxiv.org/abs/2401.01234v2, arxiv.org/pdf/2401.01234.pdf, arxiv.org/abs/hep-th/9901001, ...
+ARXIV_LINK = re.compile(r"arxiv\.org/(?:abs|pdf|html)/(?P<id>[^?#]+?)(?:\.pdf)?/?(?:[?#].*)?$")
+ARXIV_VERSION = re.compile(r"^(?P<id>.+?)(?P<version>v\d+)?$")
+
+
+def parse_arxiv_id(link):
+    """
+    Parses the arXiv identifier of a link.
+    Args:
+        link: A link to an arXiv abstract, PDF or HTML page
+
+    Returns:
+        tuple: The identifier and its version ("v2", or None for the latest), None if the
+        link is not an arXiv paper
+    """
+    match = ARXIV_LINK.search(link)
+    if match is None:
+        return None
+    match = ARXIV_VERSION.match(match.group("id"))
+    return match.group("id"), match.group("version")
+
+
+class ArxivPaperCache:
+    """
+    Process-wide LRU cache of the text of arXiv papers, keyed by identifier and version.
+    A versioned paper never changes, so entries do not expire.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, versioned_id):
+        with self._lock:
+            text = self._entries.get(versioned_id)
+            if text is not None:
+                self._entries.move_to_end(versioned_id)
+            return text
+
+    def put(self, versioned_id, text):
+        with self._lock:
+            self._entries[versioned_id] = text
+            self._entries.move_to_end(versioned_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class ArxivBatcher:
+    """
+    Resolves arXiv identifiers to their metadata in batches. Identifiers requested while
+    a batch is being collected (the links of one scrape run, which are all started
+    together) are looked up in a single `id_list` query, and queries go out one at a
+    time through one client, which keeps to arXiv's rate limit.
+    """
+
+    # Seconds identifiers are collected before the query is sent
+    BATCH_WINDOW = 0.05
+    # Identifiers per query
+    MAX_BATCH = 100
+
+    def __init__(self):
+        self.client = arxiv.Client(page_size=self.MAX_BATCH)
+        self._pending = {}
+        self._flush_task = None
+        self._query_lock = asyncio.Lock()
+
+    async def get(self, arxiv_id):
+        """
+        Args:
+            arxiv_id: arXiv identifier, with or without version
+
+        Returns:
+            arxiv.Result: The paper, None if arXiv does not know it or the query failed
+        """
+        future = self._pending.get(arxiv_id)
+        if future is None:
+            future = self._pending[arxiv_id] = asyncio.get_running_loop().create_future()
+            if self._flush_task is None:
+                self._flush_task = asyncio.ensure_future(self._flush())
+        # Shielded, a cancelled scrape must not fail the batch for the other links
+        return await asyncio.shield(future)
+
+    async def _flush(self):
+        await asyncio.sleep(self.BATCH_WINDOW)
+        batch = dict(list(self._pending.items())[:self.MAX_BATCH])
+        for arxiv_id in batch:
+            del self._pending[arxiv_id]
+        self._flush_task = asyncio.ensure_future(self._flush()) if self._pending else None
+
+        try:
+            async with self._query_lock:
+                # The arxiv client is blocking, keep it off the event loop
+                results = await asyncio.to_thread(self._query, list(batch))
+        except Exception as e:
+            print(f"Error! : arXiv lookup of {len(batch)} papers failed: {e}")
+            results = []
+
+        papers = {}
+        for result in results:
+            versioned_id = result.get_short_id()
+            papers[versioned_id] = result
+            papers.setdefault(ARXIV_VERSION.match(versioned_id).group("id"), result)
+        for arxiv_id, future in batch.items():
+            if not future.done():
+                future.set_result(papers.get(arxiv_id))
+
+    def _query(self, ids):
+        search = arxiv.Search(id_list=ids, max_results=len(ids))
+        return list(self.client.results(search))
+
+
+_paper_cache = ArxivPaperCache()
+# One batcher per event loop, it holds futures of that loop
+_batchers = {}
+
+
+def get_arxiv_batcher():
+    return get_loop_local(_batchers, ArxivBatcher)
 
 
 class ArxivScraper:
 
-    def __init__(self, link, session=None):
+    def __init__(self, link, session=None, headers=None, fetcher=None):
+        """
+        Initialize the ArxivScraper class.
+        Args:
+            link: The arXiv link
+            session: Optional HTTP session, the shared one by default
+            headers: Request headers
+            fetcher: The Scraper running this one, whose page cache, request limits and
+                extraction pool the PDF download goes through
+        """
         self.link = link
         self.session = session
+        self.headers = headers or {}
+        self.fetcher = fetcher
 
-    def scrape(self):
+    async def scrape(self):
+        """
+        The function looks up the arXiv paper of the link, together with the other arXiv links being
+        scraped at the same time, and returns the text of its PDF. Papers are cached by identifier and
+        version, so a versioned link that was scraped before costs no request at all.
+
+        Returns:
+          The text of the paper, its title and abstract if the PDF cannot be read, or an empty string
+        if the link is not a known arXiv paper.
         """
-        The function scrapes relevant documents from Arxiv based on a given link and returns the content
-        of the first document.
-        
+        parsed = parse_arxiv_id(self.link)
+        if parsed is None:
+            return ""
+        arxiv_id, version = parsed
+        if version:
+            text = _paper_cache.get(arxiv_id + version)
+            if text is not None:
+                return text
+
+        paper = await get_arxiv_batcher().get(arxiv_id + (version or ""))
+        if paper is None:
+            return ""
+        versioned_id = paper.get_short_id()
+        text = _paper_cache.get(versioned_id)
+        if text is None:
+            text = await self.download_text(paper)
+            if text is None:
+                # Not cached, the PDF may be readable next time
+                return f"{paper.title}\n{paper.summary}"
+            _paper_cache.put(versioned_id, text)
+        return text
+
+    async def download_text(self, paper):
+        """
+        Downloads the PDF of a paper and extracts its text, through the fetcher when there
+        is one, else directly over the shared session.
+        Args:
+            paper: The arxiv.Result of the paper
+
         Returns:
-          The code is returning the page content of the first document retrieved by the ArxivRetriever
-        for a given query extracted from the link.
+            str: The text of the paper, None if the PDF cannot be read
         """
-        query = self.link.split("/")[-1]
-        retriever = ArxivRetriever(load_max_docs=2, doc_content_chars_max=None)
-        docs = retriever.get_relevant_documents(query=query)
-        return docs[0].page_content
+        session = self.session or get_http_session()
+        try:
+            if self.fetcher is not None:
+                return await self.fetcher.fetch_text(paper.pdf_url, session, PyMuPDFScraper) or None
+            async with session.get(paper.pdf_url, headers=self.headers) as response:
+                response.raise_for_status()
+                content, _ = await read_body(response, PyMuPDFScraper)
+            # PDF parsing is CPU bound, keep it off the event loop
+            return await asyncio.to_thread(PyMuPDFScraper(paper.pdf_url).extract, content)
+        except Exception as e:
+            print(f"Error! : {paper.pdf_url}: {e}")
+            return None
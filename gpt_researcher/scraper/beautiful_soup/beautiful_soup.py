@@ -1,16 +1,26 @@
-from bs4 import BeautifulSoup
+import aiohttp
+
+from gpt_researcher.scraper.beautiful_soup.main_content import extract_main_content
+from gpt_researcher.scraper.download import HTML_CONTENT_TYPES, read_body
 
 
 class BeautifulSoupScraper:
 
-    def __init__(self, link, session=None):
+    # Options of the GET request issued for this scraper
+    request_kwargs = {"timeout": aiohttp.ClientTimeout(total=4)}
+    # Content types worth downloading, and whether a page cut off at the size cap is still usable
+    content_types = HTML_CONTENT_TYPES
+    truncatable = True
+
+    def __init__(self, link, session=None, headers=None):
         self.link = link
         self.session = session
+        self.headers = headers or {}
 
-    def scrape(self):
+    async def scrape(self):
         """
-        This function scrapes content from a webpage by making a GET request, parsing the HTML using
-        BeautifulSoup, and extracting script and style elements before returning the cleaned content.
+        This function scrapes content from a webpage by making a GET request and extracting the text of
+        its main content, without scripts, styles and boilerplate.
         
         Returns:
           The `scrape` method is returning the cleaned and extracted content from the webpage specified
@@ -19,35 +29,26 @@ class BeautifulSoupScraper:
         occurs during the process, an error message is printed and an empty string is returned.
         """
         try:
-            response = self.session.get(self.link, timeout=4)
-            soup = BeautifulSoup(
-                response.content, "lxml", from_encoding=response.encoding
-            )
-
-            for script_or_style in soup(["script", "style"]):
-                script_or_style.extract()
-
-            raw_content = self.get_content_from_url(soup)
-            lines = (line.strip() for line in raw_content.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            content = "\n".join(chunk for chunk in chunks if chunk)
-            return content
+            async with self.session.get(
+                self.link, headers=self.headers, **self.request_kwargs
+            ) as response:
+                content, _ = await read_body(response, self)
+                encoding = response.charset
+            return self.extract(content, encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
             return ""
-        
-    def get_content_from_url(self, soup):
-        """Get the text from the soup
+
+    def extract(self, content, encoding=None):
+        """Extracts the main text from the raw HTML of a page, leaving out navigation, footers,
+        banners and other boilerplate
 
         Args:
-            soup (BeautifulSoup): The soup to get the text from
+            content (bytes): The raw HTML
+            encoding (str): The encoding announced by the server, if any
 
         Returns:
-            str: The text from the soup
+            str: The text of the page's paragraphs and headings, one per line
         """
-        text = ""
-        tags = ["p", "h1", "h2", "h3", "h4", "h5"]
-        for element in soup.find_all(tags):  # Find all the <p> elements
-            text += element.text + "\n"
-        return text
+        return extract_main_content(content, encoding)
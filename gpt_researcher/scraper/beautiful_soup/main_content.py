@@ -0,0 +1,177 @@
+from lxml import etree
+
+# Elements whose text makes up the content of a page
+TEXT_TAGS = {"p", "h1", "h2", "h3", "h4", "h5"}
+# Elements never holding content, dropped with everything inside them
+SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "iframe", "button", "select"}
+# Elements usually holding boilerplate, set aside with everything inside them
+BOILERPLATE_TAGS = {"nav", "footer", "aside"}
+# Elements wrapping the content itself, whose own class / id are not checked for boilerplate
+CONTENT_TAGS = {"html", "body", "main", "article"}
+BOILERPLATE_ROLES = {"navigation", "banner", "contentinfo", "complementary", "dialog", "alert", "menu"}
+# Class and id tokens of boilerplate, matched whole so e.g. "has-sidebar" is not taken for a sidebar
+BOILERPLATE_NAMES = {
+    "nav", "navbar", "navigation", "menu", "menubar", "footer", "sidebar", "breadcrumb", "breadcrumbs",
+    "cookie", "cookies", "cookie-banner", "cookie-consent", "consent", "gdpr", "banner", "share", "sharing",
+    "social", "advert", "ads", "promo", "popup", "modal", "newsletter", "subscribe", "site-nav",
+    "site-header", "site-footer",
+}
+CHUNK_SIZE = 64 * 1024
+
+
+class MainContentExtractor:
+    """
+    Streaming extractor of the main text of an HTML page.
+
+    The page is fed to lxml's pull parser chunk by chunk, and the text of every paragraph
+    and heading is collected as soon as the element is closed. Scripts, styles and
+    widgets are skipped as a whole subtree. Boilerplate (navigation, footers, sidebars,
+    cookie banners) is recognized from its tag, role, class or id and set aside as a
+    whole subtree, and only left out of the result if it does not hold most of the
+    page's text, so a page wrapped in a misleadingly named element keeps its content.
+    Finished elements are cleared so the tree never holds more than the open path.
+    """
+
+    def __init__(self, encoding=None):
+        """
+        Initialize the MainContentExtractor class.
+        Args:
+            encoding: The encoding announced by the server, if any
+        """
+        try:
+            self.parser = self._parser(encoding)
+        except LookupError:
+            # Unknown encoding name, let lxml detect it
+            self.parser = self._parser(None)
+        # (boilerplate subtree number or None, text) of every paragraph and heading
+        self.texts = []
+        # Number of characters of the text of every boilerplate subtree
+        self.boilerplate_sizes = []
+        # Depth inside a skipped subtree, a boilerplate subtree, a collected element and the page's main content
+        self._skipping = 0
+        self._boilerplate = 0
+        self._collecting = 0
+        self._in_content = 0
+
+    @staticmethod
+    def _parser(encoding):
+        # Without huge_tree libxml2 stops at 256 levels of nesting or very large text
+        # nodes and silently drops the rest of the page, size is capped by the download limit
+        return etree.HTMLPullParser(
+            events=("start", "end"), encoding=encoding, remove_comments=True, remove_pis=True,
+            huge_tree=True,
+        )
+
+    def feed(self, data):
+        """
+        Parses the next chunk of the page.
+        Args:
+            data: Bytes of the page
+        """
+        self.parser.feed(data)
+        self._handle_events()
+
+    def close(self):
+        """
+        Finishes parsing the page.
+
+        Returns:
+            str: The text of the page, one paragraph or heading per line
+        """
+        try:
+            self.parser.close()
+        except etree.XMLSyntaxError:
+            # Nothing parseable, e.g. an empty body
+            pass
+        self._handle_events()
+        total = sum(len(text) for _, text in self.texts)
+        # Boilerplate holding most of the page's text is the page's content after all
+        kept = {number for number, size in enumerate(self.boilerplate_sizes) if size > total / 2}
+        return "\n".join(text for number, text in self.texts if number is None or number in kept)
+
+    def _handle_events(self):
+        for event, element in self.parser.read_events():
+            if event == "start":
+                self._start(element)
+            else:
+                self._end(element)
+
+    def _start(self, element):
+        if self._skipping or self._is_skipped(element):
+            self._skipping += 1
+            return
+        if self._boilerplate:
+            self._boilerplate += 1
+        elif self._is_boilerplate(element):
+            self._boilerplate = 1
+            self.boilerplate_sizes.append(0)
+        if element.tag in ("main", "article"):
+            self._in_content += 1
+        if element.tag in TEXT_TAGS:
+            self._collecting += 1
+
+    def _end(self, element):
+        if self._skipping:
+            self._skipping -= 1
+            element.clear(keep_tail=True)
+            return
+        if element.tag in ("main", "article"):
+            self._in_content -= 1
+        if element.tag in TEXT_TAGS:
+            self._collecting -= 1
+            if self._collecting == 0:
+                text = " ".join("".join(element.itertext()).split())
+                if text:
+                    number = len(self.boilerplate_sizes) - 1 if self._boilerplate else None
+                    if number is not None:
+                        self.boilerplate_sizes[number] += len(text)
+                    self.texts.append((number, text))
+        if self._boilerplate:
+            self._boilerplate -= 1
+        if self._collecting == 0:
+            # Done with the element, and nothing around it is collected
+            element.clear(keep_tail=True)
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    @staticmethod
+    def _is_skipped(element):
+        return not isinstance(element.tag, str) or element.tag in SKIP_TAGS
+
+    def _is_boilerplate(self, element):
+        tag = element.tag
+        if tag in BOILERPLATE_TAGS:
+            return True
+        if tag == "header" and not self._in_content:
+            # The page header, unlike an article's header holding its title
+            return True
+        if tag in CONTENT_TAGS:
+            return False
+        attrib = element.attrib
+        if "hidden" in attrib or attrib.get("aria-hidden") == "true":
+            return True
+        if attrib.get("role") in BOILERPLATE_ROLES:
+            return True
+        names = f"{attrib.get('class', '')} {attrib.get('id', '')}".lower().split()
+        return not BOILERPLATE_NAMES.isdisjoint(names)
+
+
+def extract_main_content(content, encoding=None):
+    """
+    Extracts the main text of an HTML page in one streaming pass.
+    Args:
+        content: The raw HTML
+        encoding: The encoding announced by the server, if any
+
+    Returns:
+        str: The text of the page's paragraphs and headings, one per line
+    """
+    if isinstance(content, str):
+        content, encoding = content.encode("utf-8"), "utf-8"
+    extractor = MainContentExtractor(encoding)
+    view = memoryview(content)
+    for offset in range(0, len(content), CHUNK_SIZE):
+        extractor.feed(bytes(view[offset:offset + CHUNK_SIZE]))
+    return extractor.close()
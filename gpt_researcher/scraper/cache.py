@@ -0,0 +1,198 @@
+import os
+import sqlite3
+import threading
+import time
+
+from gpt_researcher.utils.url import canonicalize_url
+
+
+class PageCache:
+    """
+    Persistent cache of scraped page content, keyed by URL and the scraper that
+    extracted it.
+
+    Each entry keeps the extracted text together with the ETag / Last-Modified
+    validators the server sent, so stale entries can be revalidated with a
+    conditional GET instead of being downloaded and parsed again. Entries older
+    than `ttl` seconds are stale, and the least recently used ones are evicted once
+    the stored content grows beyond `max_bytes`.
+
+    Lookups do not commit: access times are collected in memory and written in batches,
+    and the size of the stored content is kept as a running total. Every method blocks
+    on the database, call them from a worker thread in async code.
+    """
+
+    # Access times collected by lookups before they are written
+    ACCESS_BATCH = 256
+
+    def __init__(self, path, ttl=86400, max_bytes=512 * 1024 * 1024):
+        """
+        Initialize the PageCache class.
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds an entry is served without revalidation
+            max_bytes: Upper bound of the stored content size
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Key -> last access time, not written yet
+        self._accessed = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                url TEXT PRIMARY KEY,
+                raw_content TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS pages_lru ON pages (accessed_at)")
+        self._conn.commit()
+        self._total = self._stored_size()
+
+    @staticmethod
+    def key(url, scraper=""):
+        """Returns the cache key of a url extracted by the named scraper"""
+        return f"{scraper}:{canonicalize_url(url)}"
+
+    def get(self, url, scraper=""):
+        """
+        Looks up a url in the cache.
+        Args:
+            url: The url of the page
+            scraper: Name of the configured scraper, pages are cached per scraper
+
+        Returns:
+            dict: The cached entry with `raw_content`, `etag`, `last_modified` and whether it
+            is still `fresh`, or None when the url is not cached
+        """
+        now = time.time()
+        key = self.key(url, scraper)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw_content, etag, last_modified, fetched_at FROM pages WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = now
+            if len(self._accessed) >= self.ACCESS_BATCH:
+                self._write_accessed()
+                self._conn.commit()
+
+        raw_content, etag, last_modified, fetched_at = row
+        return {
+            "raw_content": raw_content,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": now - fetched_at < self.ttl,
+        }
+
+    def put(self, url, raw_content, etag=None, last_modified=None, scraper=""):
+        """
+        Stores the extracted content of a page and evicts old entries if needed.
+        Args:
+            url: The url of the page
+            raw_content: The extracted text
+            etag: The ETag response header, if any
+            last_modified: The Last-Modified response header, if any
+            scraper: Name of the configured scraper
+        """
+        now = time.time()
+        key = self.key(url, scraper)
+        size = len(raw_content.encode("utf-8"))
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM pages WHERE url = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, raw_content, etag, last_modified, now, now, size),
+            )
+            self._accessed.pop(key, None)
+            self._total += size - (replaced[0] if replaced else 0)
+            self._write_accessed()
+            if self._total > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def revalidated(self, url, scraper=""):
+        """
+        Marks an entry as fresh again after the server answered 304 Not Modified.
+        Args:
+            url: The url of the page
+            scraper: Name of the configured scraper
+        """
+        now = time.time()
+        key = self.key(url, scraper)
+        with self._lock:
+            self._accessed.pop(key, None)
+            self._conn.execute(
+                "UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, key),
+            )
+            self._write_accessed()
+            self._conn.commit()
+
+    def _write_accessed(self):
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE pages SET accessed_at = ? WHERE url = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+            )
+            self._accessed.clear()
+
+    def _stored_size(self):
+        return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+
+    def _evict(self):
+        # Other processes sharing the file may have written or evicted meanwhile
+        self._total = self._stored_size()
+        if self._total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT url, size FROM pages ORDER BY accessed_at")
+        evicted = []
+        for url, size in rows:
+            if self._total <= self.max_bytes:
+                break
+            evicted.append((url,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM pages WHERE url = ?", evicted)
+
+
+_page_caches = {}
+_page_caches_lock = threading.Lock()
+
+
+def get_page_cache(cfg):
+    """
+    Returns the process-wide page cache configured in `cfg`, so every researcher in
+    the process shares one database connection.
+    Args:
+        cfg: Config
+
+    Returns:
+        PageCache: The page cache, or None when caching is disabled
+    """
+    path = cfg.scraper_cache_path
+    if not path:
+        return None
+    path = os.path.expanduser(path)
+    with _page_caches_lock:
+        if path not in _page_caches:
+            _page_caches[path] = PageCache(
+                path,
+                ttl=cfg.scraper_cache_ttl,
+                max_bytes=cfg.scraper_cache_max_mb * 1024 * 1024,
+            )
+        return _page_caches[path]
@@ -0,0 +1,162 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+
+from gpt_researcher.utils.loops import get_loop_local
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD controller of the number of page requests in flight.
+
+    The window grows by one request per window's worth of healthy responses, and is
+    halved when requests time out, fail to connect or get a 5xx, at most once per
+    `cooldown` seconds so one burst of failures only counts once. A response is
+    healthy when its latency stays within `latency_factor` times the best smoothed
+    latency seen. The request timeout follows the smoothed latency and its deviation,
+    the way TCP derives its retransmission timeout.
+    """
+
+    def __init__(self, min_window=4, max_window=64, initial_window=16, latency_factor=3.0,
+                 min_timeout=3.0, max_timeout=30.0, initial_timeout=4.0, cooldown=1.0):
+        """
+        Initialize the AdaptiveConcurrency class.
+        Args:
+            min_window: Lowest concurrency limit
+            max_window: Highest concurrency limit
+            initial_window: Concurrency limit to start with
+            latency_factor: Slowdown against the best latency that stops the window growing
+            min_timeout: Lowest per-request timeout in seconds
+            max_timeout: Highest per-request timeout in seconds
+            initial_timeout: Per-request timeout until latencies were measured
+            cooldown: Seconds after a decrease during which failures do not decrease again
+        """
+        self.min_window = min_window
+        self.max_window = max_window
+        self.window = float(min(max(initial_window, min_window), max_window))
+        self.latency_factor = latency_factor
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.initial_timeout = initial_timeout
+        self.cooldown = cooldown
+
+        self.in_flight = 0
+        self.smoothed_latency = None
+        self.latency_deviation = 0.0
+        self.best_latency = None
+        self.successes = 0
+        self.failures = 0
+        self._last_decrease = 0.0
+        self._waiters = deque()
+
+    @property
+    def limit(self):
+        """Current number of requests allowed in flight"""
+        return int(self.window)
+
+    @property
+    def request_timeout(self):
+        """Per-request timeout in seconds, derived from the measured latencies"""
+        if self.smoothed_latency is None:
+            return self.initial_timeout
+        timeout = self.smoothed_latency + 4 * self.latency_deviation
+        return min(max(timeout, self.min_timeout), self.max_timeout)
+
+    def stats(self):
+        """Snapshot of the controller for monitoring"""
+        return {
+            "window": self.limit,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "request_timeout": round(self.request_timeout, 2),
+            "smoothed_latency": round(self.smoothed_latency, 3) if self.smoothed_latency is not None else None,
+            "successes": self.successes,
+            "failures": self.failures,
+        }
+
+    async def acquire(self):
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot while being cancelled, hand it on
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def succeeded(self, latency=None):
+        """
+        Records a response and grows the window when its latency is healthy.
+        Args:
+            latency: Seconds the request took, None for requests whose latency says nothing
+                about the timeout (large downloads), they count as healthy
+        """
+        self.successes += 1
+        if latency is not None:
+            if self.smoothed_latency is None:
+                self.smoothed_latency = latency
+                self.latency_deviation = latency / 2
+            else:
+                self.latency_deviation = 0.75 * self.latency_deviation + 0.25 * abs(self.smoothed_latency - latency)
+                self.smoothed_latency = 0.875 * self.smoothed_latency + 0.125 * latency
+            self.best_latency = min(self.best_latency or self.smoothed_latency, self.smoothed_latency)
+
+        if self.best_latency is None or self.smoothed_latency <= self.latency_factor * self.best_latency:
+            self.window = min(self.max_window, self.window + 1 / self.window)
+            self._wake()
+
+    def failed(self):
+        """Records a timeout, connection error or server error and shrinks the window"""
+        self.failures += 1
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self._last_decrease = now
+            self.window = max(self.min_window, self.window / 2)
+
+    @asynccontextmanager
+    async def slot(self):
+        """Holds one request slot"""
+        await self.acquire()
+        try:
+            yield self
+        finally:
+            self.release()
+
+
+# One controller per event loop, like the pooled HTTP session whose requests it limits
+_controllers = {}
+
+
+def get_concurrency_controller(cfg):
+    """
+    Returns the process-wide concurrency controller of the running event loop, so every
+    research run in the process shares one window.
+    Args:
+        cfg: Config
+
+    Returns:
+        AdaptiveConcurrency: The controller
+    """
+    return get_loop_local(_controllers, lambda: AdaptiveConcurrency(
+        min_window=cfg.scraper_min_concurrency,
+        max_window=cfg.scraper_max_concurrency,
+        initial_window=cfg.scraper_initial_concurrency,
+    ))
@@ -0,0 +1,87 @@
+import asyncio
+
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.http import get_http_session
+from gpt_researcher.utils.url import canonicalize_url
+
+
+class ScrapeCoordinator:
+    """
+    Run-scoped single-flight scraper.
+
+    Every url is scraped at most once per research run: the first sub-query asking for
+    a page starts the scrape, and every other sub-query asking for it awaits the same
+    task and gets the same extracted text. A scrape is only cancelled once no sub-query
+    is waiting for it anymore.
+    """
+
+    def __init__(self, cfg):
+        """
+        Initialize the ScrapeCoordinator class.
+        Args:
+            cfg: Config of the research run
+        """
+        self.cfg = cfg
+        self._scraper = None
+        # Canonical url -> task scraping it
+        self._pages = {}
+        # Canonical url -> number of sub-queries waiting for it
+        self._waiters = {}
+
+    @property
+    def scraper(self):
+        # Built on first use, the domain scheduler belongs to the running event loop
+        if self._scraper is None:
+            self._scraper = Scraper.from_config([], self.cfg)
+        return self._scraper
+
+    def scrape(self, url):
+        """
+        Returns the task scraping the url, starting it if no sub-query did yet.
+        Args:
+            url: The url to scrape
+
+        Returns:
+            asyncio.Task: Resolves to the page ({"url", "raw_content"})
+        """
+        key = canonicalize_url(url)
+        task = self._pages.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self.scraper.extract_data_from_link(url, get_http_session(self.cfg)))
+            self._pages[key] = task
+        return task
+
+    async def stream(self, urls):
+        """
+        Yields the page of every url as soon as it is scraped, whichever sub-query started
+        the scrape. Closing the generator early releases the urls it was waiting for.
+        Args:
+            urls: List of urls
+
+        Yields:
+            page: dict with the url and raw_content of the page
+        """
+        tasks = {}
+        for url in urls:
+            key = canonicalize_url(url)
+            if key not in tasks:
+                tasks[key] = self.scrape(url)
+                self._waiters[key] = self._waiters.get(key, 0) + 1
+        # Shielded, so one sub-query giving up does not cancel the scrape for the others
+        waits = [asyncio.shield(task) for task in tasks.values()]
+        try:
+            for next_done in asyncio.as_completed(waits):
+                page = await next_done
+                if page["raw_content"] is not None:
+                    yield page
+        finally:
+            for wait in waits:
+                wait.cancel()
+            for key, task in tasks.items():
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0:
+                    del self._waiters[key]
+                    if not task.done():
+                        # Nobody wants the page anymore, a later sub-query may start it again
+                        task.cancel()
+                        del self._pages[key]
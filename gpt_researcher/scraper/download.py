@@ -0,0 +1,115 @@
+import aiohttp
+
+# Bodies are read in chunks of this size, so oversized downloads stop early
+CHUNK_SIZE = 64 * 1024
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+
+# Content types the HTML scrapers can extract text from
+HTML_CONTENT_TYPES = ("text/", "application/xhtml+xml", "application/xml")
+# Content types servers use when they do not know better
+UNKNOWN_CONTENT_TYPES = ("application/octet-stream", "binary/octet-stream", "application/unknown")
+
+# Leading bytes of binary formats that are regularly served under a text content type
+BINARY_SIGNATURES = (
+    b"%PDF",
+    b"PK\x03\x04",          # zip, docx, xlsx, epub
+    b"\x1f\x8b",            # gzip
+    b"7z\xbc\xaf\x27\x1c",
+    b"Rar!",
+    b"\x89PNG",
+    b"\xff\xd8\xff",        # jpeg
+    b"GIF8",
+    b"RIFF",                # wav, avi, webp
+    b"OggS",
+    b"ID3",                 # mp3
+    b"fLaC",
+    b"\x1aE\xdf\xa3",       # mkv, webm
+)
+
+
+class ContentRejected(Exception):
+    """Raised when a response is not worth downloading for the scraper it was meant for"""
+
+
+def looks_binary(head):
+    """
+    Sniffs the first bytes of a body for binary content.
+    Args:
+        head: The first bytes of the body
+
+    Returns:
+        bool: True if the bytes start with a known binary signature or contain NUL bytes
+    """
+    return head.startswith(BINARY_SIGNATURES) or head[4:8] == b"ftyp" or b"\x00" in head[:1024]
+
+
+def accepts_content_type(scraper, content_type):
+    """Whether the scraper can handle a response announced with this content type"""
+    if not content_type or content_type in UNKNOWN_CONTENT_TYPES:
+        return True
+    return content_type.startswith(scraper.content_types)
+
+
+def accepts_head(scraper, head):
+    """Whether the first bytes of a body match what the scraper can handle"""
+    signature = getattr(scraper, "signature", None)
+    if signature:
+        return signature in head[:1024]
+    return not looks_binary(head)
+
+
+async def read_body(response: aiohttp.ClientResponse, scraper, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Streams the body of a response for a scraper. The download is aborted as soon as the
+    Content-Type header or the first bytes show content the scraper cannot use. Bodies
+    larger than `max_bytes` are cut off there, or rejected if the scraper cannot handle
+    a truncated document.
+    Args:
+        response: The response to read
+        scraper: The scraper class or instance the body is for
+        max_bytes: Maximum number of bytes to download
+
+    Returns:
+        tuple: The body and whether it was truncated
+
+    Raises:
+        ContentRejected: If the content is not usable by the scraper
+    """
+    body, truncated, _ = await read_routed_body(response, [scraper], max_bytes)
+    return body, truncated
+
+
+async def read_routed_body(response: aiohttp.ClientResponse, scrapers, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Streams the body of a response for whichever of the scrapers can use it, going by the
+    Content-Type header first and the sniffed first bytes second, so a PDF served from an
+    extensionless url or as application/octet-stream still reaches the PDF scraper from
+    the one download.
+    Args:
+        response: The response to read
+        scrapers: Candidate scraper classes or instances, in order of preference
+        max_bytes: Maximum number of bytes to download
+
+    Returns:
+        tuple: The body, whether it was truncated and the scraper it is for
+
+    Raises:
+        ContentRejected: If the content is not usable by any of the scrapers
+    """
+    candidates = [scraper for scraper in scrapers if accepts_content_type(scraper, response.content_type)]
+    if not candidates:
+        raise ContentRejected(f"{response.url} is {response.content_type}")
+
+    body = bytearray()
+    scraper = None
+    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+        if scraper is None:
+            scraper = next((candidate for candidate in candidates if accepts_head(candidate, chunk)), None)
+            if scraper is None:
+                raise ContentRejected(f"{response.url} does not look like {candidates[0].content_types[0]} content")
+        body += chunk
+        if len(body) >= max_bytes:
+            if not scraper.truncatable:
+                raise ContentRejected(f"{response.url} is larger than {max_bytes} bytes")
+            return bytes(body[:max_bytes]), True, scraper
+    return bytes(body), False, scraper or candidates[0]
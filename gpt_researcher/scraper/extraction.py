@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+
+def default_workers():
+    """Number of CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _extract(scraper_class, link, body, encoding):
+    # Runs in a worker process, the scraper class is sent by reference
+    return scraper_class(link).extract(body, encoding)
+
+
+class ExtractionPool:
+    """
+    Process pool that turns downloaded pages into text. HTML and PDF parsing are CPU
+    bound and hold the GIL, so in the event loop's process they stall downloads and
+    serialize on one core. Raw bytes are sent to worker processes instead, which
+    lets parsing scale across cores independently of the network I/O.
+
+    Workers are started from a fork server (spawned where there is none) rather than
+    forked from the researcher's process, which runs threads, an event loop and
+    open connections a forked child would inherit in an undefined state. Such workers
+    import the script that started the researcher, so that script must guard its top
+    level with `if __name__ == "__main__":`.
+
+    A pool that breaks is restarted once. If the fresh pool breaks too, or cannot start
+    at all, the pool is given up with a warning and pages are parsed in a thread of the
+    researcher's own process from then on, so a broken setup never silently yields
+    empty pages.
+    """
+
+    def __init__(self, max_workers=None):
+        """
+        Initialize the ExtractionPool class.
+        Args:
+            max_workers: Number of worker processes, the number of CPUs by default
+        """
+        self.max_workers = max_workers or default_workers()
+        self._executor = None
+        self._lock = threading.Lock()
+        # Set once the workers failed to run twice in a row
+        self.disabled = False
+
+    @property
+    def executor(self):
+        # Workers are only started once the first page needs parsing
+        with self._lock:
+            if self._executor is None:
+                method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers, mp_context=multiprocessing.get_context(method)
+                )
+            return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+    async def extract(self, scraper, body, encoding=None):
+        """
+        Extracts the text of a downloaded page in a worker process.
+        Args:
+            scraper: The scraper instance the body was downloaded for
+            body: The raw bytes of the page
+            encoding: The encoding announced by the server, if any
+
+        Returns:
+            str: The extracted text
+        """
+        for _ in range(2):
+            if self.disabled:
+                break
+            try:
+                executor = self.executor
+            except (OSError, RuntimeError, ValueError) as e:
+                self._disable(f"the worker processes cannot start: {e}")
+                break
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    executor, _extract, type(scraper), scraper.link, body, encoding
+                )
+            except BrokenProcessPool as e:
+                # A worker died (e.g. a parser crashed on a page), start over with a fresh pool
+                print(f"Error! : extraction pool broke on {scraper.link}, restarting it: {e}")
+                self._reset(executor)
+        else:
+            self._disable("the worker processes keep dying")
+        return await asyncio.to_thread(scraper.extract, body, encoding)
+
+    def _disable(self, reason):
+        if not self.disabled:
+            self.disabled = True
+            print(
+                f"Error! : giving up the extraction pool, {reason}. Pages are parsed in threads of this "
+                f"process from now on. If the researcher is started from a script, guard its top level "
+                f"with `if __name__ == \"__main__\":`, or set SCRAPER_EXTRACTION_WORKERS=0."
+            )
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+_extraction_pools = {}
+_extraction_pools_lock = threading.Lock()
+
+
+def get_extraction_pool(cfg):
+    """
+    Returns the process-wide extraction pool configured in `cfg`, so every researcher
+    in the process shares one set of worker processes.
+    Args:
+        cfg: Config
+
+    Returns:
+        ExtractionPool: The pool, or None when pages are to be parsed in-process
+    """
+    workers = cfg.scraper_extraction_workers
+    if workers is None:
+        workers = default_workers()
+    if workers <= 0:
+        return None
+    with _extraction_pools_lock:
+        if workers not in _extraction_pools:
+            _extraction_pools[workers] = ExtractionPool(workers)
+        return _extraction_pools[workers]
@@ -1,21 +1,47 @@
-from langchain_community.document_loaders import PyMuPDFLoader
+import pymupdf
+
+from gpt_researcher.scraper.download import read_body
 
 
 class PyMuPDFScraper:
 
-    def __init__(self, link, session=None):
+    # Options of the GET request issued for this scraper
+    request_kwargs = {}
+    # Content types worth downloading, the magic bytes the body must start with, and whether
+    # a document cut off at the size cap is still usable (a PDF is not, its xref table is at the end).
+    # text/plain is a common mislabel, the signature decides
+    content_types = ("application/pdf", "application/x-pdf", "text/plain")
+    signature = b"%PDF"
+    truncatable = False
+
+    def __init__(self, link, session=None, headers=None):
         self.link = link
         self.session = session
+        self.headers = headers or {}
 
-    def scrape(self) -> str:
+    async def scrape(self) -> str:
         """
-        The `scrape` function uses PyMuPDFLoader to load a document from a given link and returns it as
-        a string.
+        The `scrape` function downloads the PDF at the given link through the shared async session
+        and extracts its text with PyMuPDF.
         
         Returns:
-          The `scrape` method is returning a string representation of the `doc` object, which is loaded
-        using PyMuPDFLoader from the provided link.
+          The `scrape` method is returning the text of every page of the PDF document, one page
+        after the other.
+        """
+        async with self.session.get(self.link, headers=self.headers, **self.request_kwargs) as response:
+            response.raise_for_status()
+            content, _ = await read_body(response, self)
+        return self.extract(content)
+
+    def extract(self, content, encoding=None) -> str:
+        """Extracts the text from the raw bytes of a PDF document
+
+        Args:
+            content (bytes): The PDF document
+            encoding (str): Unused, kept for parity with the HTML scrapers
+
+        Returns:
+            str: The text of the document
         """
-        loader = PyMuPDFLoader(self.link)
-        doc = loader.load()
-        return str(doc)
+        with pymupdf.open(stream=content, filetype="pdf") as doc:
+            return "\n".join(page.get_text() for page in doc)
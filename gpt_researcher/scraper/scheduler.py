@@ -0,0 +1,151 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+from gpt_researcher.utils.loops import get_loop_local
+
+# Longest a throttled host is left alone before it is tried again
+MAX_BACKOFF = 60
+
+
+class HostLimiter:
+    """
+    Politeness state of a single host: a concurrency cap, a token bucket refilled at
+    `rate` requests per second, and a backoff window entered whenever the host
+    answers 429 / 503. Every throttle halves the rate, every success wins part of
+    it back.
+    """
+
+    def __init__(self, max_concurrency=4, rate=2.0):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = max_concurrency
+        self.tokens = float(max_concurrency)
+        self.updated = time.monotonic()
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.blocked_until = 0.0
+        self.backoff = 0.0
+        # Requests holding or waiting for a slot
+        self.pending = 0
+
+    @property
+    def idle(self):
+        return self.pending == 0 and self.blocked_until <= time.monotonic()
+
+    async def acquire(self):
+        self.pending += 1
+        try:
+            await self.semaphore.acquire()
+        except BaseException:
+            self.pending -= 1
+            raise
+        try:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                wait = self.blocked_until - now
+                if wait <= 0:
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self):
+        self.pending -= 1
+        self.semaphore.release()
+
+    def throttled(self, retry_after=None):
+        """
+        Backs off after a 429 / 503, for `retry_after` seconds when the server said so,
+        exponentially longer on every consecutive throttle otherwise.
+        """
+        self.backoff = min(max(self.backoff * 2, 1.0), MAX_BACKOFF)
+        delay = min(retry_after, MAX_BACKOFF) if retry_after is not None else self.backoff
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        self.rate = max(self.base_rate / 16, self.rate / 2)
+
+    def succeeded(self):
+        self.backoff = 0.0
+        self.rate = min(self.base_rate, self.rate + self.base_rate / 8)
+
+
+class DomainScheduler:
+    """
+    Domain-aware fetch scheduler. Requests to the same host wait for a slot of that
+    host's HostLimiter, while requests to other hosts go ahead, so a result list
+    clustered on one domain is fetched politely without holding up the rest.
+    """
+
+    # Idle hosts are forgotten once more than this many are tracked
+    MAX_HOSTS = 1024
+
+    def __init__(self, max_per_host=4, rate_per_host=2.0):
+        """
+        Initialize the DomainScheduler class.
+        Args:
+            max_per_host: Maximum number of concurrent requests per host
+            rate_per_host: Sustained requests per second per host
+        """
+        self.max_per_host = max_per_host
+        self.rate_per_host = rate_per_host
+        self._hosts = {}
+
+    def host(self, url):
+        """Returns the limiter of the url's host"""
+        host = (urlsplit(url).hostname or "").removeprefix("www.")
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            if len(self._hosts) >= self.MAX_HOSTS:
+                self._hosts = {name: state for name, state in self._hosts.items() if not state.idle}
+            limiter = self._hosts[host] = HostLimiter(self.max_per_host, self.rate_per_host)
+        return limiter
+
+    @asynccontextmanager
+    async def slot(self, url):
+        """
+        Waits until the url's host may be requested again and holds one of its slots.
+        Args:
+            url: The url about to be requested
+
+        Yields:
+            HostLimiter: The host's limiter, to report throttling or success
+        """
+        limiter = self.host(url)
+        await limiter.acquire()
+        try:
+            yield limiter
+        finally:
+            limiter.release()
+
+
+def parse_retry_after(value):
+    """Seconds of a Retry-After header, None when missing or given as a date"""
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+# One scheduler per event loop, like the pooled HTTP session it throttles
+_schedulers = {}
+
+
+def get_domain_scheduler(cfg):
+    """
+    Returns the process-wide domain scheduler of the running event loop, so concurrent
+    research runs share each host's budget.
+    Args:
+        cfg: Config
+
+    Returns:
+        DomainScheduler: The scheduler
+    """
+    return get_loop_local(_schedulers, lambda: DomainScheduler(
+        max_per_host=cfg.scraper_max_per_host, rate_per_host=cfg.scraper_host_rate
+    ))
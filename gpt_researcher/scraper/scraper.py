@@ -1,7 +1,9 @@
-from concurrent.futures.thread import ThreadPoolExecutor
-from functools import partial
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 
-import requests
+import aiohttp
 
 from gpt_researcher.scraper import (
     ArxivScraper,
@@ -9,6 +11,13 @@ from gpt_researcher.scraper import (
     PyMuPDFScraper,
     WebBaseLoaderScraper,
 )
+from gpt_researcher.config import Config
+from gpt_researcher.scraper.cache import PageCache, get_page_cache
+from gpt_researcher.scraper.concurrency import AdaptiveConcurrency, get_concurrency_controller
+from gpt_researcher.scraper.download import DEFAULT_MAX_BYTES, read_routed_body
+from gpt_researcher.scraper.extraction import ExtractionPool, get_extraction_pool
+from gpt_researcher.scraper.scheduler import DomainScheduler, get_domain_scheduler, parse_retry_after
+from gpt_researcher.utils.http import get_http_session
 
 
 class Scraper:
@@ -16,36 +25,107 @@ class Scraper:
     Scraper class to extract the content from the links
     """
 
-    def __init__(self, urls, user_agent, scraper):
+    # Attempts per link when the host keeps answering 429 / 503
+    MAX_ATTEMPTS = 3
+
+    SCRAPER_CLASSES = {
+        "pdf": PyMuPDFScraper,
+        "arxiv": ArxivScraper,
+        "bs": BeautifulSoupScraper,
+        "web_base_loader": WebBaseLoaderScraper,
+    }
+
+    def __init__(self, urls, user_agent, scraper, cache: PageCache = None, scheduler: DomainScheduler = None,
+                 concurrency: AdaptiveConcurrency = None, max_bytes=DEFAULT_MAX_BYTES,
+                 extraction_pool: ExtractionPool = None):
         """
         Initialize the Scraper class.
         Args:
             urls:
+            user_agent:
+            scraper:
+            cache: Optional persistent page cache
+            scheduler: Optional per-domain politeness scheduler
+            concurrency: Optional adaptive limit of the requests in flight
+            max_bytes: Maximum number of bytes downloaded per page
+            extraction_pool: Optional process pool parsing the downloaded pages
         """
         self.urls = urls
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": user_agent})
+        self.headers = {"User-Agent": user_agent}
         self.scraper = scraper
+        self.cache = cache
+        self.scheduler = scheduler
+        self.concurrency = concurrency
+        self.max_bytes = max_bytes
+        self.extraction_pool = extraction_pool
+
+    @classmethod
+    def from_config(cls, urls, cfg: Config = None):
+        """
+        Builds a scraper with the user agent, page cache, domain scheduler, concurrency limit,
+        download limit and extraction pool the config asks for.
+        Args:
+            urls: List of urls
+            cfg: Config, the environment's by default
+
+        Returns:
+            Scraper: The scraper
+        """
+        cfg = cfg or Config()
+        return cls(
+            urls, cfg.user_agent, cfg.scraper,
+            cache=get_page_cache(cfg),
+            scheduler=get_domain_scheduler(cfg),
+            concurrency=get_concurrency_controller(cfg),
+            max_bytes=cfg.scraper_max_bytes,
+            extraction_pool=get_extraction_pool(cfg),
+        )
 
-    def run(self):
+    async def run(self):
         """
-        Extracts the content from the links
+        Extracts the content from the links concurrently over the shared HTTP session
         """
-        partial_extract = partial(self.extract_data_from_link, session=self.session)
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            contents = executor.map(partial_extract, self.urls)
+        session = get_http_session()
+        contents = await asyncio.gather(
+            *[self.extract_data_from_link(link, session) for link in self.urls]
+        )
         res = [content for content in contents if content["raw_content"] is not None]
         return res
 
-    def extract_data_from_link(self, link, session):
+    async def stream(self):
+        """
+        Extracts the content from the links concurrently and yields every page as soon as it
+        is scraped. Closing the generator early cancels the scrapes still in flight.
+        """
+        session = get_http_session()
+        tasks = [
+            asyncio.create_task(self.extract_data_from_link(link, session))
+            for link in self.urls
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                content = await next_done
+                if content["raw_content"] is not None:
+                    yield content
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def extract_data_from_link(self, link, session):
         """
         Extracts the data from the link
         """
         content = ""
         try:
             Scraper = self.get_scraper(link)
-            scraper = Scraper(link, session)
-            content = scraper.scrape()
+            if Scraper is ArxivScraper:
+                # Fetches the paper's PDF through `fetch_text`, which holds the request slots itself
+                content = await ArxivScraper(link, session, headers=self.headers, fetcher=self).scrape()
+            elif hasattr(Scraper, "extract"):
+                content = await self.fetch_text(link, session, Scraper)
+            else:
+                async with self.concurrency_slot():
+                    content = await Scraper(link, session, headers=self.headers).scrape()
 
             if len(content) < 100:
                 return {"url": link, "raw_content": None}
@@ -53,6 +133,159 @@ class Scraper:
         except Exception as e:
             return {"url": link, "raw_content": None}
 
+    async def fetch_text(self, link, session, scraper_class):
+        """
+        Returns the text of a link read by the given scraper class, from the page cache
+        when it is fresh there, or downloaded under the host and concurrency limits and
+        extracted in the extraction pool.
+        Args:
+            link: The url to fetch
+            session: The HTTP session
+            scraper_class: The scraper class to start with, the content type may route to another
+
+        Returns:
+            str: The extracted text
+        """
+        cached = None
+        if self.cache:
+            # The lookup blocks on the database and on cache writes, keep it off the event loop
+            cached = await asyncio.to_thread(self.cache.get, link, self.scraper)
+        if cached and cached["fresh"]:
+            return cached["raw_content"]
+        scraper = scraper_class(link, session, headers=self.headers)
+        return await self.fetch_and_extract(link, session, scraper, cached)
+
+    async def fetch_and_extract(self, link, session, scraper, cached=None):
+        """
+        Downloads the link and extracts its text with the scraper its content calls
+        for, starting from the one picked from the link. When a stale cache entry is
+        available, the request is made conditional on its validators, so an unchanged
+        page costs a 304 and no parsing.
+        """
+        headers = dict(self.headers)
+        if cached:
+            if cached["etag"]:
+                headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            async with self.host_slot(link) as host, self.concurrency_slot() as concurrency:
+                response = await self.download(link, session, headers, scraper, concurrency)
+            throttled = response["status"] in (429, 503)
+            if host and throttled:
+                host.throttled(response["retry_after"])
+            elif host:
+                host.succeeded()
+            if not throttled or attempt == self.MAX_ATTEMPTS:
+                break
+
+        if response["status"] == 304 and cached:
+            await asyncio.to_thread(self.cache.revalidated, link, self.scraper)
+            return cached["raw_content"]
+
+        if not isinstance(scraper, response["scraper"]):
+            # Routed by the content type, hand the downloaded bytes over instead of fetching again
+            scraper = response["scraper"](link, session, headers=self.headers)
+        content = await self.extract(scraper, response["body"], response["encoding"])
+        if self.cache and response["status"] == 200 and len(content) >= 100:
+            await asyncio.to_thread(
+                self.cache.put, link, content,
+                etag=response["etag"], last_modified=response["last_modified"], scraper=self.scraper,
+            )
+        return content
+
+    async def download(self, link, session, headers, scraper, concurrency=None):
+        """
+        Sends a single GET request and streams the response body, up to `max_bytes`.
+        Content the scraper cannot use is rejected from its headers or first bytes
+        without downloading the rest. Latency and failures are reported to the
+        concurrency controller, whose adaptive timeout replaces the scraper's fixed one.
+        Requests of scrapers without a timeout (PDF downloads) are left untimed, and
+        their latencies stay out of the timeout estimate.
+
+        Returns:
+            dict: status, body, encoding, etag, last_modified and retry_after of the response,
+            and the scraper class the body is for
+        """
+        request_kwargs = dict(scraper.request_kwargs)
+        timed = "timeout" in request_kwargs
+        if concurrency and timed:
+            request_kwargs["timeout"] = aiohttp.ClientTimeout(total=concurrency.request_timeout)
+
+        started = time.monotonic()
+        try:
+            async with session.get(link, headers=headers, **request_kwargs) as response:
+                # Throttled and unchanged responses have no body worth reading
+                body, scraper_class = b"", type(scraper)
+                if response.status not in (304, 429, 503):
+                    body, _, scraper_class = await read_routed_body(
+                        response, self.get_candidates(scraper), self.max_bytes
+                    )
+                result = {
+                    "status": response.status,
+                    "body": body,
+                    "scraper": scraper_class,
+                    "encoding": response.charset,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "retry_after": parse_retry_after(response.headers.get("Retry-After")),
+                }
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            if concurrency:
+                concurrency.failed()
+            raise
+
+        if concurrency and result["status"] >= 500:
+            concurrency.failed()
+        elif concurrency and result["status"] != 429:
+            concurrency.succeeded(time.monotonic() - started if timed else None)
+        return result
+
+    async def extract(self, scraper, body, encoding=None):
+        """
+        Extracts the text of a downloaded page, in the extraction pool when one is
+        configured, so parsing does not hold up the event loop.
+        """
+        if self.extraction_pool is None:
+            return scraper.extract(body, encoding)
+        return await self.extraction_pool.extract(scraper, body, encoding)
+
+    @asynccontextmanager
+    async def concurrency_slot(self):
+        """
+        Holds one of the globally allowed request slots, when a concurrency controller
+        is configured.
+        """
+        if self.concurrency is None:
+            yield None
+            return
+        async with self.concurrency.slot() as concurrency:
+            yield concurrency
+
+    @asynccontextmanager
+    async def host_slot(self, link):
+        """
+        Holds a request slot of the link's host while the body is downloaded, when a
+        scheduler is configured.
+        """
+        if self.scheduler is None:
+            yield None
+            return
+        async with self.scheduler.slot(link) as host:
+            yield host
+
+    def get_candidates(self, scraper):
+        """
+        Scraper classes a downloaded page may be routed to once its content type is known,
+        the one picked from the link first.
+        """
+        candidates = [type(scraper)]
+        for scraper_class in (self.SCRAPER_CLASSES.get(self.scraper), PyMuPDFScraper):
+            if scraper_class is not None and scraper_class not in candidates and hasattr(scraper_class, "extract"):
+                candidates.append(scraper_class)
+        return candidates
+
     def get_scraper(self, link):
         """
         The function `get_scraper` determines the appropriate scraper class based on the provided link
@@ -66,27 +299,20 @@ class Scraper:
         Returns:
           The `get_scraper` method returns the scraper class based on the provided link. The method
         checks the link to determine the appropriate scraper class to use based on predefined mappings
-        in the `SCRAPER_CLASSES` dictionary. If the link ends with ".pdf", it selects the
-        `PyMuPDFScraper` class. If the link contains "arxiv.org", it selects the `ArxivScraper
+        in the `SCRAPER_CLASSES` dictionary. If the link's path ends with ".pdf", it selects the
+        `PyMuPDFScraper` class. If the link contains "arxiv.org", it selects the `ArxivScraper`.
+        This is only a first guess, downloaded pages are routed by their actual content type.
         """
-
-        SCRAPER_CLASSES = {
-            "pdf": PyMuPDFScraper,
-            "arxiv": ArxivScraper,
-            "bs": BeautifulSoupScraper,
-            "web_base_loader": WebBaseLoaderScraper,
-        }
-
         scraper_key = None
 
-        if link.endswith(".pdf"):
+        if urlsplit(link).path.lower().endswith(".pdf"):
             scraper_key = "pdf"
         elif "arxiv.org" in link:
             scraper_key = "arxiv"
         else:
             scraper_key = self.scraper
 
-        scraper_class = SCRAPER_CLASSES.get(scraper_key)
+        scraper_class = self.SCRAPER_CLASSES.get(scraper_key)
         if scraper_class is None:
             raise Exception("Scraper not found.")
 
@@ -1,32 +1,51 @@
+from bs4 import BeautifulSoup
+
+from gpt_researcher.scraper.download import HTML_CONTENT_TYPES, read_body
+
 
 class WebBaseLoaderScraper:
 
-    def __init__(self, link, session=None):
+    # Options of the GET request issued for this scraper
+    request_kwargs = {"ssl": False}
+    # Content types worth downloading, and whether a page cut off at the size cap is still usable
+    content_types = HTML_CONTENT_TYPES
+    truncatable = True
+
+    def __init__(self, link, session=None, headers=None):
         self.link = link
         self.session = session
+        self.headers = headers or {}
 
-    def scrape(self) -> str:
+    async def scrape(self) -> str:
         """
-        This Python function scrapes content from a webpage using a WebBaseLoader object and returns the
-        concatenated page content.
+        This Python function scrapes content from a webpage the same way LangChain's WebBaseLoader
+        does (full page text through the builtin html parser), but fetches it through the shared
+        async session instead of a blocking request.
         
         Returns:
           The `scrape` method is returning a string variable named `content` which contains the
-        concatenated page content from the documents loaded by the `WebBaseLoader`. If an exception
-        occurs during the process, an error message is printed and an empty string is returned.
+        text of the page. If an exception occurs during the process, an error message is printed
+        and an empty string is returned.
         """
         try:
-            from langchain_community.document_loaders import WebBaseLoader
-            loader = WebBaseLoader(self.link)
-            loader.requests_kwargs = {"verify": False}
-            docs = loader.load()
-            content = ""
-
-            for doc in docs:
-                content += doc.page_content
-
-            return content
+            async with self.session.get(self.link, headers=self.headers, **self.request_kwargs) as response:
+                content, _ = await read_body(response, self)
+                encoding = response.charset
+            return self.extract(content, encoding)
 
         except Exception as e:
             print("Error! : " + str(e))
             return ""
+
+    def extract(self, content, encoding=None) -> str:
+        """Extracts the full text of a page from its raw HTML
+
+        Args:
+            content (bytes): The raw HTML
+            encoding (str): The encoding announced by the server, if any
+
+        Returns:
+            str: The text of the page
+        """
+        soup = BeautifulSoup(content, "html.parser", from_encoding=encoding)
+        return soup.get_text()
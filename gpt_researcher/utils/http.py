@@ -0,0 +1,63 @@
+import asyncio
+
+import aiohttp
+
+from gpt_researcher.config import Config
+from gpt_researcher.utils.loops import get_loop_local
+
+# One pooled session per event loop, aiohttp sessions are bound to the loop they were created on
+_sessions = {}
+
+
+def get_http_session(cfg: Config = None) -> aiohttp.ClientSession:
+    """
+    Returns the process-wide pooled HTTP session for the running event loop.
+    Connections are kept alive and reused across scrapes and sub-queries, with a
+    global connection limit and a per-host limit so a single domain cannot take
+    over the whole pool. The session is closed when its event loop shuts down through
+    asyncio.run, whoever runs a loop some other way closes it with close_http_session()
+    before the loop ends.
+
+    Args:
+        cfg: Config the session is created with, the environment's by default
+
+    Returns:
+        aiohttp.ClientSession: The shared session
+    """
+    loop = asyncio.get_running_loop()
+    if loop in _sessions and _sessions[loop].closed:
+        del _sessions[loop]
+
+    def create_session():
+        config = cfg or Config()
+        connector = aiohttp.TCPConnector(
+            limit=config.http_max_connections,
+            limit_per_host=config.http_max_connections_per_host,
+            ttl_dns_cache=300,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=config.http_timeout),
+        )
+
+    return get_loop_local(_sessions, create_session, close=_close_session)
+
+
+async def close_http_session() -> None:
+    """
+    Closes the pooled HTTP session of the running event loop, if any.
+    """
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+async def _close_session(session: aiohttp.ClientSession) -> None:
+    """
+    Closes a pooled session at loop shutdown and forgets it.
+    Args:
+        session: The loop's session
+    """
+    for loop in [l for l, s in _sessions.items() if s is session]:
+        del _sessions[loop]
+    await session.close()
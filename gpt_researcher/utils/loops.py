@@ -0,0 +1,48 @@
+import asyncio
+
+# The event loop only keeps weak references to its tasks, these must live until it shuts down
+_shutdown_tasks = set()
+
+
+def get_loop_local(registry, factory, close=None):
+    """
+    Returns the object of the running event loop in a process-wide registry, created on
+    first use. Pooled sessions, schedulers and the like hold futures and locks that
+    belong to one loop, so a process that runs several loops (e.g. repeated
+    asyncio.run calls from the CLI) gets one per loop. Objects of loops that were
+    closed since are dropped.
+    Args:
+        registry: dict of event loop -> object
+        factory: Callable creating the object for the running loop
+        close: Optional coroutine function the object is closed with when its loop shuts down
+
+    Returns:
+        The running loop's object
+    """
+    loop = asyncio.get_running_loop()
+    value = registry.get(loop)
+    if value is None:
+        for stale_loop in [l for l in registry if l.is_closed()]:
+            del registry[stale_loop]
+        value = registry[loop] = factory()
+        if close is not None:
+            task = loop.create_task(_close_at_shutdown(value, close))
+            _shutdown_tasks.add(task)
+            task.add_done_callback(_shutdown_tasks.discard)
+    return value
+
+
+async def _close_at_shutdown(value, close):
+    """
+    Waits until the event loop shuts down and closes the object on its way out.
+    asyncio.run (like uvicorn and pytest-asyncio) cancels the tasks still pending
+    before it closes the loop, which lands here while the loop can still run the close.
+    Args:
+        value: The loop-local object
+        close: Coroutine function closing it
+    """
+    try:
+        await asyncio.Event().wait()
+    except asyncio.CancelledError:
+        await close(value)
+        raise
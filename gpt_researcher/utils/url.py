@@ -0,0 +1,134 @@
+import hashlib
+import math
+import threading
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from, never what the page shows
+TRACKING_PARAMS = {"gclid", "fbclid", "msclkid", "yclid", "mc_cid", "mc_eid", "ref_src", "igshid"}
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalizes a url so that the different spellings of one page compare equal.
+
+    The scheme and host are lowercased, default ports, "www." prefixes, fragments,
+    trailing slashes and tracking parameters (utm_*, gclid, ...) are dropped, and the
+    remaining query parameters are sorted. The result is meant as a key for
+    deduplication, the original url is still the one to fetch.
+    Args:
+        url: The url to normalize
+
+    Returns:
+        str: The canonical form of the url
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").removeprefix("www.")
+    if port and port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    path = parts.path.rstrip("/") or "/"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+class BloomFilter:
+    """
+    Fixed-size probabilistic set of strings. Membership tests can return false
+    positives at roughly `error_rate` once `capacity` items were added, never false
+    negatives, and memory use does not grow with the number of items.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        # Double hashing: k positions from two 64-bit halves of one digest
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def clear(self):
+        self.bits = bytearray(len(self.bits))
+
+
+class VisitedUrls:
+    """
+    Registry of the urls a research run has already picked up.
+
+    Urls are compared in their canonical form, so tracking parameters, fragments and
+    trailing slashes do not cause duplicate scrapes. `add` checks and claims a url in
+    one step under a lock, so concurrent sub-queries never both claim the same page.
+    The report's source list only gets the urls passed to `add_source` (or `update`),
+    kept as first seen, so a claimed page that was never scraped is not listed.
+    With `bloom_capacity` set, the check for urls to skip uses a Bloom filter of
+    bounded size instead of a set. The source list is always exact, a false positive
+    can only skip a scrape, never drop a page that was used from the sources.
+    """
+
+    def __init__(self, urls=None, bloom_capacity=0):
+        self._lock = threading.Lock()
+        self._seen = BloomFilter(bloom_capacity) if bloom_capacity else set()
+        # Canonical url -> url as first seen, in the order the urls were recorded
+        self._sources = {}
+        self.update(urls or [])
+
+    def __contains__(self, url):
+        return canonicalize_url(url) in self._seen
+
+    def __iter__(self):
+        return iter(list(self._sources.values()))
+
+    def __len__(self):
+        return len(self._sources)
+
+    def add(self, url):
+        """
+        Claims a url for scraping.
+        Args:
+            url: The url to claim
+
+        Returns:
+            bool: True if the url was new, False if it had been visited already
+        """
+        key = canonicalize_url(url)
+        with self._lock:
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+            return True
+
+    def add_source(self, url):
+        """Lists a url whose page was used as a source of the report"""
+        key = canonicalize_url(url)
+        with self._lock:
+            self._seen.add(key)
+            self._sources.setdefault(key, url)
+
+    def update(self, urls):
+        """Records every url of an iterable as a source, whatever the Bloom filter says"""
+        for url in list(urls):
+            self.add_source(url)
+
+    def clear(self):
+        with self._lock:
+            self._seen.clear()
+            self._sources.clear()
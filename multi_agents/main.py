@@ -8,6 +8,7 @@ from multi_agents.agents import ChiefEditorAgent
 import asyncio
 import json
 from gpt_researcher.utils.enum import Tone
+from gpt_researcher.utils.http import close_http_session
 
 # Run with LangSmith if API key is set
 if os.environ.get("LANGCHAIN_API_KEY"):
@@ -101,7 +102,10 @@ async def main():
     task = open_task()
 
     chief_editor = ChiefEditorAgent(task)
-    research_report = await chief_editor.run_research_task(task_id=uuid.uuid4())
+    try:
+        research_report = await chief_editor.run_research_task(task_id=uuid.uuid4())
+    finally:
+        await close_http_session()
 
     return research_report
 
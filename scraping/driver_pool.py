@@ -0,0 +1,221 @@
+"""Pool of long-lived headless WebDrivers for the selenium scraping path."""
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+from sys import platform
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.safari.options import Options as SafariOptions
+
+# Number of browsers kept per (browser, user agent)
+DRIVER_POOL_SIZE = 4
+# Seconds a page may take to load before the url is given up
+PAGE_LOAD_TIMEOUT = 15
+# Pages a browser serves before it is replaced, to bound leaks of long-lived browsers
+MAX_PAGES_PER_DRIVER = 50
+
+
+def create_driver(selenium_web_browser: str, user_agent: str) -> WebDriver:
+    """Start a headless browser
+
+    Args:
+        selenium_web_browser (str): The web browser to start (chrome, firefox or safari)
+        user_agent (str): The user agent used when scraping
+
+    Returns:
+        WebDriver: The webdriver of the browser
+    """
+    logging.getLogger("selenium").setLevel(logging.CRITICAL)
+
+    options_available = {
+        "chrome": ChromeOptions,
+        "safari": SafariOptions,
+        "firefox": FirefoxOptions,
+    }
+
+    options = options_available[selenium_web_browser]()
+    options.add_argument(f"user-agent={user_agent}")
+    options.add_argument("--headless")
+    options.add_argument("--enable-javascript")
+
+    if selenium_web_browser == "firefox":
+        driver = webdriver.Firefox(options=options)
+    elif selenium_web_browser == "safari":
+        # Requires a bit more setup on the users end
+        # See https://developer.apple.com/documentation/webkit/testing_with_webdriver_in_safari
+        driver = webdriver.Safari(options=options)
+    else:
+        if platform == "linux" or platform == "linux2":
+            options.add_argument("--disable-dev-shm-usage")
+            # No fixed debugging port, several pooled browsers run side by side
+            options.add_argument("--remote-debugging-port=0")
+        options.add_argument("--no-sandbox")
+        options.add_experimental_option("prefs", {"download_restrictions": 3})
+        driver = webdriver.Chrome(options=options)
+
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.set_script_timeout(PAGE_LOAD_TIMEOUT)
+    return driver
+
+
+class DriverPool:
+    """
+    Bounded pool of headless browsers shared by the scraping threads.
+
+    Starting a browser takes seconds, much longer than loading most pages, so browsers
+    are started on demand up to `size` and then reused. A browser is health-checked
+    when checked out, its tabs are recycled when checked back in so no page state leaks
+    into the next url, and it is replaced after `max_pages` pages or any failure.
+    """
+
+    def __init__(self, selenium_web_browser: str, user_agent: str, size: int = DRIVER_POOL_SIZE,
+                 max_pages: int = MAX_PAGES_PER_DRIVER):
+        """
+        Args:
+            selenium_web_browser (str): The web browser used for scraping
+            user_agent (str): The user agent used when scraping
+            size (int): Maximum number of browsers running at once
+            max_pages (int): Pages a browser serves before it is replaced
+        """
+        self.selenium_web_browser = selenium_web_browser
+        self.user_agent = user_agent
+        self.size = size
+        self.max_pages = max_pages
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle: list[WebDriver] = []
+        self._pages: dict[WebDriver, int] = {}
+        self._closed = False
+
+    def acquire(self, timeout: float | None = None) -> WebDriver:
+        """Check out a healthy browser, starting one if none is idle
+
+        Args:
+            timeout (float): Seconds to wait for a free browser, forever if None
+
+        Returns:
+            WebDriver: The browser, to be given back with `release`
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError(f"No {self.selenium_web_browser} browser free within {timeout}s")
+        try:
+            while True:
+                with self._lock:
+                    if self._closed:
+                        raise RuntimeError("The driver pool is closed")
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    driver = create_driver(self.selenium_web_browser, self.user_agent)
+                    self._pages[driver] = 0
+                    return driver
+                if self._is_healthy(driver):
+                    return driver
+                self._discard(driver)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, driver: WebDriver, healthy: bool = True) -> None:
+        """Give a browser back to the pool
+
+        Args:
+            driver (WebDriver): The browser checked out with `acquire`
+            healthy (bool): False when the browser failed and must not be reused
+        """
+        try:
+            self._pages[driver] = self._pages.get(driver, 0) + 1
+            if healthy and not self._closed and self._pages[driver] < self.max_pages and self._recycle(driver):
+                with self._lock:
+                    if not self._closed:
+                        self._idle.append(driver)
+                        return
+            self._discard(driver)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def driver(self, timeout: float | None = None):
+        """Hold a browser for the duration of the block, discarding it if the block fails"""
+        driver = self.acquire(timeout)
+        healthy = False
+        try:
+            yield driver
+            healthy = True
+        finally:
+            self.release(driver, healthy)
+
+    def close(self) -> None:
+        """Quit every idle browser, the ones checked out are quit when released"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+    @staticmethod
+    def _is_healthy(driver: WebDriver) -> bool:
+        try:
+            driver.execute_script("return document.readyState;")
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _recycle(driver: WebDriver) -> bool:
+        """Replace the browser's tabs by a single blank one"""
+        try:
+            old_handles = driver.window_handles
+            driver.switch_to.new_window("tab")
+            fresh_handle = driver.current_window_handle
+            for handle in old_handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(fresh_handle)
+            driver.delete_all_cookies()
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver: WebDriver) -> None:
+        self._pages.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+_pools: dict[tuple[str, str], DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(selenium_web_browser: str, user_agent: str) -> DriverPool:
+    """Return the process-wide driver pool of a browser and user agent
+
+    Args:
+        selenium_web_browser (str): The web browser used for scraping
+        user_agent (str): The user agent used when scraping
+
+    Returns:
+        DriverPool: The pool
+    """
+    key = (selenium_web_browser, user_agent)
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = DriverPool(selenium_web_browser, user_agent)
+        return _pools[key]
+
+
+@atexit.register
+def close_driver_pools() -> None:
+    """Quit the pooled browsers"""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -1,30 +1,38 @@
 """Selenium web scraping module."""
 from __future__ import annotations
 
-import logging
 import asyncio
+import weakref
 from pathlib import Path
-from sys import platform
 
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.common.by import By
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.safari.options import Options as SafariOptions
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from fastapi import WebSocket
 
 from scraping import scrape_skills, processing as summary
+from scraping.driver_pool import DRIVER_POOL_SIZE, PAGE_LOAD_TIMEOUT, create_driver, get_driver_pool
 from scraping.processing.html import extract_hyperlinks, format_hyperlinks
 
 from concurrent.futures import ThreadPoolExecutor
 
 from scraping.processing.text import summarize_text
 
-executor = ThreadPoolExecutor()
+# Shared by every browse, one thread per pooled browser plus room for the summaries
+executor = ThreadPoolExecutor(max_workers=DRIVER_POOL_SIZE * 2)
+# Browses holding or waiting for a pooled browser, per event loop. Only as many browses as
+# there are browsers wait in the executor, so a blocked acquire never takes the thread a
+# release needs.
+_browse_slots = weakref.WeakKeyDictionary()
+
+
+def get_browse_slots() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    if loop not in _browse_slots:
+        _browse_slots[loop] = asyncio.Semaphore(DRIVER_POOL_SIZE)
+    return _browse_slots[loop]
 
 FILE_DIR = Path(__file__).parent.parent
 
@@ -50,8 +58,8 @@ async def async_browse(
     Returns:
         str: The answer and links to the user
     """
-    loop = asyncio.get_event_loop()
-    executor = ThreadPoolExecutor(max_workers=8)
+    loop = asyncio.get_running_loop()
+    pool = get_driver_pool(selenium_web_browser, user_agent)
 
     print(f"Scraping url {url} with question {question}")
     if websocket:
@@ -64,14 +72,26 @@ async def async_browse(
     else:
         print(f"🔎 Browsing the {url} for relevant about: {question}...")
 
+    driver = None
+    healthy = False
     try:
-        driver, text = await loop.run_in_executor(
-            executor, scrape_text_with_selenium, selenium_web_browser, user_agent, url
-        )
-        await loop.run_in_executor(executor, add_header, driver)
-        summary_text = await loop.run_in_executor(
-            executor, summarize_text, fast_llm_model, summary_token_limit, llm_provider, url, text, question, driver
-        )
+        async with get_browse_slots():
+            try:
+                # Waiting for a free browser blocks, keep it off the event loop
+                driver = await loop.run_in_executor(executor, pool.acquire, PAGE_LOAD_TIMEOUT * 2)
+                driver, text = await loop.run_in_executor(
+                    executor, scrape_text_with_selenium, selenium_web_browser, user_agent, url, driver
+                )
+                # The browser did its job, a failing summary says nothing about it
+                healthy = True
+                await loop.run_in_executor(executor, add_header, driver)
+                summary_text = await loop.run_in_executor(
+                    executor, summarize_text, fast_llm_model, summary_token_limit, llm_provider, url, text, question,
+                    driver
+                )
+            finally:
+                if driver is not None:
+                    await loop.run_in_executor(executor, pool.release, driver, healthy)
         if websocket:
             await websocket.send_json(
                 {
@@ -118,43 +138,22 @@ def browse_website(url: str, question: str) -> tuple[str, WebDriver]:
     return f"Answer gathered from website: {summary_text} \n \n Links: {links}", driver
 
 
-def scrape_text_with_selenium(selenium_web_browser: str, user_agent: str, url: str) -> tuple[WebDriver, str]:
+def scrape_text_with_selenium(
+        selenium_web_browser: str, user_agent: str, url: str, driver: WebDriver | None = None
+) -> tuple[WebDriver, str]:
     """Scrape text from a website using selenium
 
     Args:
         url (str): The url of the website to scrape
         selenium_web_browser (str): The web browser used to scrape
         user_agent (str): The user agent used when scraping
+        driver (WebDriver): A running browser, e.g. from the driver pool. A new one is started if None
 
     Returns:
         Tuple[WebDriver, str]: The webdriver and the text scraped from the website
     """
-    logging.getLogger("selenium").setLevel(logging.CRITICAL)
-
-    options_available = {
-        "chrome": ChromeOptions,
-        "safari": SafariOptions,
-        "firefox": FirefoxOptions,
-    }
-
-    options = options_available[selenium_web_browser]()
-    options.add_argument(f"user-agent={user_agent}")
-    options.add_argument("--headless")
-    options.add_argument("--enable-javascript")
-
-    if selenium_web_browser == "firefox":
-        driver = webdriver.Firefox(options=options)
-    elif selenium_web_browser == "safari":
-        # Requires a bit more setup on the users end
-        # See https://developer.apple.com/documentation/webkit/testing_with_webdriver_in_safari
-        driver = webdriver.Safari(options=options)
-    else:
-        if platform == "linux" or platform == "linux2":
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--remote-debugging-port=9222")
-        options.add_argument("--no-sandbox")
-        options.add_experimental_option("prefs", {"download_restrictions": 3})
-        driver = webdriver.Chrome(options=options)
+    if driver is None:
+        driver = create_driver(selenium_web_browser, user_agent)
 
     print(f"scraping url {url}...")
     driver.get(url)
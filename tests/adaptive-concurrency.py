@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from conftest import article
+from gpt_researcher.scraper.concurrency import AdaptiveConcurrency
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.http import get_http_session
+
+
+class Site:
+    """Local pages whose status and latency the test changes as it goes"""
+
+    def __init__(self):
+        self.status = 200
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def page(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.status != 200:
+                return web.Response(status=self.status)
+            return web.Response(text=article(request.path), content_type="text/html")
+        finally:
+            self.in_flight -= 1
+
+
+@pytest_asyncio.fixture
+async def site(serve):
+    site = Site()
+    site.base = await serve([web.get("/{name}", site.page)])
+    return site
+
+
+async def scrape(site, concurrency, count=1):
+    scraper = Scraper([], "gpt-researcher-tests", "bs", concurrency=concurrency)
+    session = get_http_session()
+    return await asyncio.gather(
+        *[scraper.extract_data_from_link(f"{site.base}/page{i}", session) for i in range(count)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_window_grows_with_healthy_responses(site):
+    concurrency = AdaptiveConcurrency(min_window=2, max_window=16, initial_window=4)
+
+    for _ in range(20):
+        await scrape(site, concurrency)
+
+    # One request per window's worth of successes
+    assert 6 <= concurrency.limit <= 8
+    assert concurrency.successes == 20
+    assert concurrency.smoothed_latency is not None
+
+
+@pytest.mark.asyncio
+async def test_window_stops_growing_when_latency_degrades(site):
+    concurrency = AdaptiveConcurrency(min_window=2, max_window=16, initial_window=4)
+    for _ in range(10):
+        await scrape(site, concurrency)
+    window = concurrency.window
+
+    # Far beyond three times the best latency seen on the loopback interface
+    site.delay = 0.5
+    for _ in range(5):
+        await scrape(site, concurrency)
+
+    assert concurrency.window == window
+
+
+@pytest.mark.asyncio
+async def test_window_halves_on_server_errors(site):
+    concurrency = AdaptiveConcurrency(min_window=2, max_window=16, initial_window=16, cooldown=0)
+
+    site.status = 500
+    await scrape(site, concurrency)
+    assert concurrency.limit == 8
+    await scrape(site, concurrency)
+    assert concurrency.limit == 4
+    for _ in range(3):
+        await scrape(site, concurrency)
+    assert concurrency.limit == 2
+    assert concurrency.failures == 5
+
+
+@pytest.mark.asyncio
+async def test_burst_of_failures_halves_once(site):
+    concurrency = AdaptiveConcurrency(min_window=2, max_window=16, initial_window=16, cooldown=10)
+
+    site.status = 500
+    await scrape(site, concurrency, count=8)
+
+    assert concurrency.limit == 8
+    assert concurrency.failures == 8
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_shrink_the_window():
+    concurrency = AdaptiveConcurrency(min_window=2, max_window=16, initial_window=16)
+    # Nothing listens on port 9 of the loopback interface
+    scraper = Scraper([], "gpt-researcher-tests", "bs", concurrency=concurrency)
+
+    page = await scraper.extract_data_from_link("http://127.0.0.1:9/page", get_http_session())
+
+    assert page["raw_content"] is None
+    assert concurrency.limit == 8
+
+
+@pytest.mark.asyncio
+async def test_requests_in_flight_stay_within_the_window(site):
+    concurrency = AdaptiveConcurrency(min_window=2, max_window=2, initial_window=2)
+    site.delay = 0.1
+
+    pages = await scrape(site, concurrency, count=8)
+
+    assert all(page["raw_content"] for page in pages)
+    assert site.max_in_flight == 2
+    assert concurrency.in_flight == 0
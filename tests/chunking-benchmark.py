@@ -0,0 +1,85 @@
+"""
+Memory and throughput benchmark of the span chunker against langchain's
+RecursiveCharacterTextSplitter, on the text of the saved pages in
+tests/fixtures/pages, repeated to the size of a large research run.
+
+    python tests/chunking-benchmark.py [--pages N] [--repeat N]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from pathlib import Path
+
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from gpt_researcher.context.chunking import ChunkStore
+from gpt_researcher.scraper.beautiful_soup.main_content import extract_main_content
+
+FIXTURES = Path(__file__).parent / "fixtures" / "pages"
+
+
+def load_pages(count):
+    texts = [extract_main_content(page.read_bytes()) for page in sorted(FIXTURES.glob("*.html"))]
+    # Distinct strings, like separately scraped pages
+    return [
+        {"url": f"https://example.com/{i}", "title": f"Page {i}", "raw_content": f"{i}\n{texts[i % len(texts)]}"}
+        for i in range(count)
+    ]
+
+
+def split_with_langchain(pages):
+    # What ContextIndex and the compressors did before
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+    return splitter.split_documents([
+        Document(page_content=page["raw_content"], metadata={"title": page["title"], "source": page["url"]})
+        for page in pages
+    ])
+
+
+def split_with_spans(pages):
+    chunks = ChunkStore()
+    for page in pages:
+        chunks.add(page["raw_content"], {"title": page["title"], "source": page["url"]})
+    return chunks
+
+
+def measure(split, pages, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        split(pages)
+        timings.append(time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    chunks = split(pages)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(timings), retained, peak, len(chunks)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    megabytes = sum(len(page["raw_content"]) for page in pages) / 1024 / 1024
+    print(f"{args.pages} pages, {megabytes:.1f} MB of text\n")
+    print(f"{'splitter':<12}{'chunks':>8}{'seconds':>10}{'MB/s':>8}{'retained MB':>13}{'peak MB':>10}")
+    results = {}
+    for name, split in [("langchain", split_with_langchain), ("spans", split_with_spans)]:
+        seconds, retained, peak, count = measure(split, pages, args.repeat)
+        results[name] = (seconds, retained)
+        print(f"{name:<12}{count:>8}{seconds:>10.3f}{megabytes / seconds:>8.1f}"
+              f"{retained / 1024 / 1024:>13.1f}{peak / 1024 / 1024:>10.1f}")
+
+    print(f"\nspans: {results['langchain'][0] / results['spans'][0]:.1f}x faster, "
+          f"{results['langchain'][1] / results['spans'][1]:.1f}x less memory retained")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import pytest_asyncio
+from aiohttp import web
+
+# Long enough for every extractor, which drops pages under 100 characters
+ARTICLE = "<html><body><article><h1>{title}</h1><p>{text}</p></article></body></html>"
+
+
+def article(title="Test page", words=60):
+    """HTML of a page whose text survives extraction"""
+    return ARTICLE.format(title=title, text=" ".join(f"word{i}" for i in range(words)))
+
+
+@pytest_asyncio.fixture
+async def serve():
+    """
+    Starts a local aiohttp server for the routes given, served on the test's event loop.
+    Returns the server's base url, no outside network needed.
+    """
+    runners = []
+
+    async def start(routes):
+        app = web.Application()
+        app.add_routes(routes)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        runners.append(runner)
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        host, port = runner.addresses[0][:2]
+        return f"http://{host}:{port}"
+
+    yield start
+    for runner in runners:
+        await runner.cleanup()
@@ -0,0 +1,77 @@
+"""
+Benchmark of the BeautifulSoupScraper text extraction against the previous
+BeautifulSoup tree + find_all implementation, on the saved pages in
+tests/fixtures/pages (or any directory of .html files given as argument). The
+fixtures are published documentation pages as served: the Rust book and standard
+library docs, the Node.js API docs and the npm CLI docs.
+
+    python tests/content-extraction-benchmark.py [pages_dir] [--repeat N]
+"""
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from gpt_researcher.scraper.beautiful_soup.main_content import extract_main_content
+
+FIXTURES = Path(__file__).parent / "fixtures" / "pages"
+# Text that only appears in the boilerplate of the fixture pages: the Node.js docs header,
+# the Rust book's keyboard help, rustdoc's sidebar and path button
+BOILERPLATE = ["Node.js v20.19.5 documentation", "Keyboard shortcuts", "In std::collections", "Copy item path"]
+
+
+def extract_with_soup(content, encoding=None):
+    # The extraction BeautifulSoupScraper used before, kept as the baseline
+    soup = BeautifulSoup(content, "lxml", from_encoding=encoding)
+    for script_or_style in soup(["script", "style"]):
+        script_or_style.extract()
+    text = ""
+    for element in soup.find_all(["p", "h1", "h2", "h3", "h4", "h5"]):
+        text += element.text + "\n"
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return "\n".join(chunk for chunk in chunks if chunk)
+
+
+def measure(extract, content, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        text = extract(content)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), text
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pages", nargs="?", default=FIXTURES, type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    pages = sorted(args.pages.glob("*.html"))
+    totals = {"soup": 0.0, "stream": 0.0}
+    size = 0
+    print(f"{'page':<28}{'KB':>8}{'soup ms':>10}{'stream ms':>11}{'speedup':>9}{'soup chars':>12}"
+          f"{'stream chars':>14}{'boilerplate soup/stream':>25}")
+    for page in pages:
+        content = page.read_bytes()
+        size += len(content)
+        soup_time, soup_text = measure(extract_with_soup, content, args.repeat)
+        stream_time, stream_text = measure(extract_main_content, content, args.repeat)
+        totals["soup"] += soup_time
+        totals["stream"] += stream_time
+        soup_noise = sum(soup_text.count(marker) for marker in BOILERPLATE)
+        stream_noise = sum(stream_text.count(marker) for marker in BOILERPLATE)
+        print(f"{page.name:<28}{len(content) / 1024:>8.0f}{soup_time * 1000:>10.1f}{stream_time * 1000:>11.1f}"
+              f"{soup_time / stream_time:>8.1f}x{len(soup_text):>12}{len(stream_text):>14}"
+              f"{f'{soup_noise}/{stream_noise}':>25}")
+
+    megabytes = size / 1024 / 1024
+    print(f"\nsoup:   {megabytes / totals['soup']:.1f} MB/s")
+    print(f"stream: {megabytes / totals['stream']:.1f} MB/s ({totals['soup'] / totals['stream']:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
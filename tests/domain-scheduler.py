@@ -0,0 +1,105 @@
+import asyncio
+import time
+from collections import Counter
+
+import pytest
+from aiohttp import web
+
+from conftest import article
+from gpt_researcher.scraper.scheduler import DomainScheduler
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.http import get_http_session
+
+# Fast enough that only the backoff shows in the elapsed time
+RATE = 100
+
+
+def throttling_site(serve, hits, status, retry_after=None, throttled=1):
+    """Serves `status` to the first `throttled` requests of every path, then the page"""
+    async def page(request):
+        hits[request.path] += 1
+        if hits[request.path] <= throttled:
+            headers = {"Retry-After": retry_after} if retry_after is not None else {}
+            return web.Response(status=status, headers=headers)
+        return web.Response(text=article(request.path), content_type="text/html")
+
+    return serve([web.get("/{name}", page)])
+
+
+async def scrape(url, scheduler):
+    scraper = Scraper([url], "gpt-researcher-tests", "bs", scheduler=scheduler)
+    return await scraper.extract_data_from_link(url, get_http_session())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status, retry_after", [
+    (429, "1"),
+    (503, "1"),
+    # Without Retry-After the first backoff is one second
+    (429, None),
+    # A date is not understood, the exponential backoff applies
+    (503, "Wed, 21 Oct 2015 07:28:00 GMT"),
+])
+async def test_throttled_host_is_retried_after_backoff(serve, status, retry_after):
+    hits = Counter()
+    base = await throttling_site(serve, hits, status, retry_after)
+    scheduler = DomainScheduler(max_per_host=4, rate_per_host=RATE)
+
+    started = time.monotonic()
+    page = await scrape(f"{base}/page", scheduler)
+    elapsed = time.monotonic() - started
+
+    assert page["raw_content"]
+    assert hits["/page"] == 2
+    assert elapsed >= 0.9
+    # The throttle halved the host's rate, the success then won part of it back
+    limiter = scheduler.host(base)
+    assert limiter.rate < RATE
+    assert limiter.backoff == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_sets_the_backoff(serve):
+    hits = Counter()
+    base = await throttling_site(serve, hits, 429, retry_after="2")
+    scheduler = DomainScheduler(max_per_host=4, rate_per_host=RATE)
+
+    started = time.monotonic()
+    page = await scrape(f"{base}/page", scheduler)
+
+    assert page["raw_content"]
+    assert time.monotonic() - started >= 1.8
+
+
+@pytest.mark.asyncio
+async def test_throttled_host_does_not_hold_up_other_hosts(serve):
+    hits = Counter()
+    throttled = await throttling_site(serve, hits, 429, retry_after="2")
+    other = await throttling_site(serve, Counter(), 429, throttled=0)
+    scheduler = DomainScheduler(max_per_host=4, rate_per_host=RATE)
+
+    async def timed(url):
+        started = time.monotonic()
+        page = await scrape(url, scheduler)
+        return page, time.monotonic() - started
+
+    # 127.0.0.1 and localhost are different hosts to the scheduler
+    (slow_page, slow), (fast_page, fast) = await asyncio.gather(
+        timed(f"{throttled}/page"), timed(f"{other.replace('127.0.0.1', 'localhost')}/page")
+    )
+
+    assert slow_page["raw_content"] and fast_page["raw_content"]
+    assert slow >= 1.8
+    assert fast < 1
+
+
+@pytest.mark.asyncio
+async def test_host_that_keeps_throttling_is_given_up(serve):
+    hits = Counter()
+    base = await throttling_site(serve, hits, 503, retry_after="0", throttled=Scraper.MAX_ATTEMPTS)
+    scheduler = DomainScheduler(max_per_host=4, rate_per_host=RATE)
+
+    page = await scrape(f"{base}/page", scheduler)
+
+    assert page["raw_content"] is None
+    assert hits["/page"] == Scraper.MAX_ATTEMPTS
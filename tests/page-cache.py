@@ -0,0 +1,120 @@
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from conftest import article
+from gpt_researcher.scraper.cache import PageCache
+from gpt_researcher.scraper.scraper import Scraper
+from gpt_researcher.utils.http import get_http_session
+
+ETAG = '"v1"'
+# Size of one cached page
+PAGE = "x" * 1000
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "pages.sqlite")
+
+
+def test_least_recently_used_pages_are_evicted(cache_path):
+    cache = PageCache(cache_path, max_bytes=3 * len(PAGE))
+    for name in ("a", "b", "c"):
+        cache.put(f"https://example.com/{name}", PAGE)
+
+    # "a" was read after "b" was written, so "b" is the least recently used
+    assert cache.get("https://example.com/a")
+    cache.put("https://example.com/d", PAGE)
+
+    assert cache.get("https://example.com/b") is None
+    for name in ("a", "c", "d"):
+        assert cache.get(f"https://example.com/{name}")["raw_content"] == PAGE
+
+
+def test_size_budget_survives_reopening(cache_path):
+    cache = PageCache(cache_path, max_bytes=2 * len(PAGE))
+    cache.put("https://example.com/a", PAGE)
+    cache.put("https://example.com/b", PAGE)
+
+    reopened = PageCache(cache_path, max_bytes=2 * len(PAGE))
+    reopened.put("https://example.com/c", PAGE)
+
+    assert reopened.get("https://example.com/a") is None
+    assert reopened.get("https://example.com/c")
+
+
+def test_pages_are_cached_per_scraper_and_canonical_url(cache_path):
+    cache = PageCache(cache_path)
+    cache.put("https://www.example.com/page/?utm_source=feed", PAGE, scraper="bs")
+
+    assert cache.get("https://example.com/page", scraper="bs")["raw_content"] == PAGE
+    assert cache.get("https://example.com/page", scraper="web_base_loader") is None
+
+
+class Site:
+    """A page served with an ETag, answering 304 when the client already has it"""
+
+    def __init__(self):
+        self.statuses = Counter()
+        self.text = article("Cached page")
+
+    async def page(self, request):
+        if request.headers.get("If-None-Match") == ETAG:
+            status, text = 304, None
+        else:
+            status, text = 200, self.text
+        self.statuses[status] += 1
+        return web.Response(status=status, text=text, content_type="text/html", headers={"ETag": ETAG})
+
+
+@pytest_asyncio.fixture
+async def site(serve):
+    site = Site()
+    site.base = await serve([web.get("/{name}", site.page)])
+    return site
+
+
+async def scrape(url, cache):
+    scraper = Scraper([url], "gpt-researcher-tests", "bs", cache=cache)
+    return await scraper.extract_data_from_link(url, get_http_session())
+
+
+@pytest.mark.asyncio
+async def test_fresh_pages_are_served_without_a_request(site, cache_path):
+    cache = PageCache(cache_path, ttl=3600)
+    url = f"{site.base}/page"
+
+    first = await scrape(url, cache)
+    second = await scrape(url, cache)
+
+    assert first["raw_content"] and second["raw_content"] == first["raw_content"]
+    assert site.statuses == {200: 1}
+
+
+@pytest.mark.asyncio
+async def test_stale_pages_are_revalidated_with_their_etag(site, cache_path):
+    cache = PageCache(cache_path, ttl=0)
+    url = f"{site.base}/page"
+
+    first = await scrape(url, cache)
+    assert cache.get(url, "bs")["etag"] == ETAG
+    second = await scrape(url, cache)
+
+    assert second["raw_content"] == first["raw_content"]
+    assert site.statuses == {200: 1, 304: 1}
+
+
+@pytest.mark.asyncio
+async def test_changed_pages_replace_the_cached_text(site, cache_path):
+    cache = PageCache(cache_path, ttl=0)
+    url = f"{site.base}/page"
+    cache.put(url, PAGE, etag='"v0"', scraper="bs")
+
+    page = await scrape(url, cache)
+
+    assert page["raw_content"] != PAGE
+    assert cache.get(url, "bs")["raw_content"] == page["raw_content"]
+    assert cache.get(url, "bs")["etag"] == ETAG
+    assert site.statuses == {200: 1}
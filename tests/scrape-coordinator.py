@@ -0,0 +1,98 @@
+import asyncio
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from conftest import article
+from gpt_researcher.config import Config
+from gpt_researcher.scraper.coordinator import ScrapeCoordinator
+
+# Seconds the server takes per page, so scrapes are still in flight when sub-queries overlap
+DELAY = 0.3
+
+
+def local_config():
+    cfg = Config()
+    cfg.scraper = "bs"
+    cfg.scraper_cache_path = ""
+    cfg.scraper_extraction_workers = 0
+    cfg.scraper_host_rate = 100
+    return cfg
+
+
+@pytest.fixture
+def hits():
+    return Counter()
+
+
+@pytest_asyncio.fixture
+async def site(serve, hits):
+    async def page(request):
+        hits[request.path] += 1
+        await asyncio.sleep(DELAY)
+        return web.Response(text=article(request.path), content_type="text/html")
+
+    return await serve([web.get("/{name}", page)])
+
+
+async def collect(pages):
+    return [page async for page in pages]
+
+
+@pytest.mark.asyncio
+async def test_sub_queries_share_one_scrape(site, hits):
+    base = site
+    coordinator = ScrapeCoordinator(local_config())
+
+    first, second = await asyncio.gather(
+        collect(coordinator.stream([f"{base}/shared", f"{base}/first"])),
+        collect(coordinator.stream([f"{base}/shared?utm_source=feed", f"{base}/second"])),
+    )
+
+    assert hits == {"/shared": 1, "/first": 1, "/second": 1}
+    shared = [page for page in first + second if "/shared" in page["url"]]
+    assert len(shared) == 2
+    assert shared[0]["raw_content"] == shared[1]["raw_content"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_one_waiter_keeps_the_scrape_for_the_others(site, hits):
+    base = site
+    coordinator = ScrapeCoordinator(local_config())
+    url = f"{base}/shared"
+
+    leaving = coordinator.stream([url])
+    leaving_task = asyncio.create_task(anext(leaving))
+    staying = asyncio.create_task(collect(coordinator.stream([url])))
+    await asyncio.sleep(DELAY / 3)
+    leaving_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leaving_task
+
+    pages = await staying
+    assert [page["url"] for page in pages] == [url]
+    assert pages[0]["raw_content"]
+    assert hits["/shared"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_last_waiter_cancels_the_scrape(site, hits):
+    base = site
+    coordinator = ScrapeCoordinator(local_config())
+    url = f"{base}/abandoned"
+
+    pages = coordinator.stream([url])
+    waiting = asyncio.create_task(anext(pages))
+    await asyncio.sleep(DELAY / 3)
+    scrape = coordinator.scrape(url)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    await asyncio.gather(scrape, return_exceptions=True)
+    assert scrape.cancelled()
+    # A later sub-query starts the page afresh
+    assert coordinator.scrape(url) is not scrape
+    assert [page["url"] async for page in coordinator.stream([url])] == [url]
@@ -0,0 +1,63 @@
+import asyncio
+import functools
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("selenium")
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from scraping import driver_pool
+from scraping.driver_pool import DriverPool
+
+# Served locally, no outside network needed
+PAGES_DIR = Path(__file__).parent / "fixtures" / "pages"
+BROWSER = "chrome"
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) gpt-researcher-tests"
+
+
+@pytest.fixture(scope="module")
+def browser():
+    try:
+        driver_pool.create_driver(BROWSER, USER_AGENT).quit()
+    except WebDriverException as e:
+        pytest.skip(f"no {BROWSER} browser to drive: {e.msg}")
+    return BROWSER
+
+
+@pytest.fixture(scope="module")
+def site():
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(PAGES_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_driver_pool_reuses_browsers(browser, site, monkeypatch):
+    started = []
+    create_driver = driver_pool.create_driver
+    monkeypatch.setattr(driver_pool, "create_driver", lambda *args: started.append(1) or create_driver(*args))
+
+    pool = DriverPool(browser, USER_AGENT, size=2)
+    urls = [f"{site}/{page.name}" for page in sorted(PAGES_DIR.glob("*.html"))] * 3
+
+    def scrape(url):
+        with pool.driver(timeout=60) as driver:
+            driver.get(url)
+            return driver.find_element(By.TAG_NAME, "body").text
+
+    try:
+        texts = await asyncio.gather(*[asyncio.to_thread(scrape, url) for url in urls])
+    finally:
+        pool.close()
+
+    assert all(texts)
+    # Every url after the first two ran on a recycled browser
+    assert len(started) <= 2